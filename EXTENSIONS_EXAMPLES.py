@@ -4,6 +4,7 @@ This file demonstrates various customization examples
 """
 
 import os
+import threading
 from datetime import datetime
 
 # ===========================================
@@ -11,6 +12,10 @@ from datetime import datetime
 # ===========================================
 
 # Edit issue_detector.py and add to _load_issue_patterns():
+# Patterns are compiled once per IssueDetector and also joined into a single
+# alternation, so messages that match none of them cost one regex scan in
+# total. Keep each pattern self-contained (no backreferences or named groups)
+# so it can be embedded in that alternation.
 
 CUSTOM_PATTERN_EXAMPLE = {
     "category": "Custom Issue Category",
@@ -27,6 +32,9 @@ CUSTOM_PATTERN_EXAMPLE = {
 
 # Add a new method to ReportGenerator class in report_generator.py:
 
+CSV_REPORT_HEADER = ('Issue ID', 'Category', 'Severity', 'User Count',
+                     'Occurrences', 'Root Cause', 'Solution')
+
 class ReportGeneratorExample:
     def __init__(self, output_dir="reports"):
         self.output_dir = output_dir
@@ -34,25 +42,21 @@ class ReportGeneratorExample:
     def generate_csv_report_example(self, report):
         """Generate CSV format report"""
         import csv
+        import io
         
         filename = f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         filepath = os.path.join(self.output_dir, filename)
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        # A 1 MiB buffer keeps large reports to a handful of write syscalls
+        with open(filepath, 'wb', buffering=1 << 20) as raw, \
+                io.TextIOWrapper(raw, encoding='utf-8', newline='') as f:
             writer = csv.writer(f)
-            writer.writerow(['Issue ID', 'Category', 'Severity', 'User Count', 
-                            'Occurrences', 'Root Cause', 'Solution'])
-            
-            for issue in report.get_sorted_issues():
-                writer.writerow([
-                    issue.issue_id,
-                    issue.category,
-                    issue.severity,
-                    issue.user_count,
-                    issue.occurrences,
-                    issue.root_cause,
-                    issue.solution
-                ])
+            writer.writerow(CSV_REPORT_HEADER)
+            writer.writerows(
+                (issue.issue_id, issue.category, issue.severity, issue.user_count,
+                 issue.occurrences, issue.root_cause, issue.solution)
+                for issue in report.get_sorted_issues()
+            )
         
         print(f"CSV Report saved: {filepath}")
 
@@ -68,10 +72,14 @@ class DatabaseDataSourceExample:
     def __init__(self, db_config):
         self.db_config = db_config
         
-    def get_log_entries_database_example(self):
-        """Example implementation for database reading"""
+    def iter_log_entries_database_example(self, itersize=10000):
+        """Example implementation for database reading
+        
+        Streams rows through a server-side (named) cursor so only
+        ``itersize`` rows are held client-side at a time.
+        """
         import psycopg2
-        from datetime import datetime
+        from itertools import starmap
         
         # Connect to database
         conn = psycopg2.connect(
@@ -81,43 +89,35 @@ class DatabaseDataSourceExample:
             password=self.db_config['password']
         )
         
-        cursor = conn.cursor()
-        
-        # Query log entries
-        query = """
-            SELECT 
-                event_number, level, source, event_id, 
-                timestamp, message, log_type, user_id, 
-                system_name, session_timestamp
-            FROM log_entries
-            WHERE timestamp >= NOW() - INTERVAL '7 days'
-            ORDER BY timestamp DESC
-        """
-        
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        
-        # Convert to LogEntry objects
-        log_entries = []
-        for row in rows:
-            entry = LogEntry(
-                event_number=row[0],
-                level=row[1],
-                source=row[2],
-                event_id=row[3],
-                timestamp=row[4],
-                message=row[5],
-                log_type=row[6],
-                user_id=row[7],
-                system_name=row[8],
-                session_timestamp=row[9]
-            )
-            log_entries.append(entry)
-        
-        cursor.close()
-        conn.close()
-        
-        return log_entries
+        try:
+            # Named cursors are server-side; rows arrive in itersize batches
+            cursor = conn.cursor(name='log_stream')
+            cursor.itersize = itersize
+            
+            # Query log entries
+            query = """
+                SELECT 
+                    event_number, level, source, event_id, 
+                    timestamp, message, log_type, user_id, 
+                    system_name, session_timestamp
+                FROM log_entries
+                WHERE timestamp >= NOW() - INTERVAL '7 days'
+                ORDER BY timestamp ASC
+            """
+            
+            cursor.execute(query)
+            
+            # Column order matches the LogEntry fields, so each row maps
+            # positionally without building keyword arguments per entry
+            yield from starmap(LogEntry, cursor)
+            
+            cursor.close()
+        finally:
+            conn.close()
+    
+    def get_log_entries_database_example(self):
+        """Materialize the streamed entries for callers that need a list"""
+        return list(self.iter_log_entries_database_example())
 
 # ===========================================
 # EXAMPLE 4: Custom Log Parser
@@ -130,32 +130,23 @@ def parse_custom_format_example(file_path):
     from datetime import datetime
     from models import LogEntry
     
+    # datetime.fromisoformat is implemented in C and accepts
+    # "YYYY-MM-DD HH:MM:SS" directly, avoiding strptime's per-call
+    # format compilation
+    parse_timestamp = datetime.fromisoformat
     log_entries = []
+    append = log_entries.append
     
     with open(file_path, 'r') as f:
         for line in f:
             # Parse your custom format
             # Example: "2026-01-23 10:30:45 | ERROR | Message text"
-            parts = line.split('|')
+            parts = line.split('|', 3)
             if len(parts) >= 3:
-                timestamp_str = parts[0].strip()
-                level = parts[1].strip()
-                message = parts[2].strip()
-                
-                # Create LogEntry object
-                entry = LogEntry(
-                    event_number=0,
-                    level=level,
-                    source="Custom",
-                    event_id=0,
-                    timestamp=datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S'),
-                    message=message,
-                    log_type="Custom",
-                    user_id="unknown",
-                    system_name="unknown",
-                    session_timestamp=""
-                )
-                log_entries.append(entry)
+                # Create LogEntry object (positional, in field order)
+                append(LogEntry(0, parts[1].strip(), "Custom", 0,
+                                parse_timestamp(parts[0].strip()),
+                                parts[2].strip(), "Custom", "unknown", "unknown", ""))
     
     return log_entries
 
@@ -165,22 +156,64 @@ def parse_custom_format_example(file_path):
 
 # In main.py, add filtering logic:
 
-def filter_by_date_example(log_entries, start_date, end_date):
-    """Filter log entries by date range"""
-    from datetime import datetime
+def build_timestamp_index_example(log_entries):
+    """Build a NumPy array of epoch timestamps, once per loaded entry list"""
+    import numpy as np
     
-    filtered = [
-        entry for entry in log_entries
-        if start_date <= entry.timestamp <= end_date
-    ]
+    return np.fromiter(
+        (entry.timestamp.timestamp() for entry in log_entries),
+        dtype=np.float64,
+        count=len(log_entries)
+    )
+
+def filter_by_date_example(log_entries, start_date, end_date,
+                           timestamps=None, assume_sorted=False):
+    """Filter log entries by date range
+    
+    The date comparison runs as a single vectorized NumPy pass over
+    ``timestamps`` (see build_timestamp_index_example). Pass the array in
+    when filtering the same entries repeatedly. When the entries are in
+    ascending timestamp order, ``assume_sorted=True`` turns the filter
+    into two binary searches and a slice.
+    """
+    import numpy as np
+    
+    if timestamps is None:
+        timestamps = build_timestamp_index_example(log_entries)
+    start = start_date.timestamp()
+    end = end_date.timestamp()
+    
+    if assume_sorted:
+        lo = np.searchsorted(timestamps, start, side='left')
+        hi = np.searchsorted(timestamps, end, side='right')
+        return log_entries[lo:hi]
     
-    return filtered
+    mask = (timestamps >= start) & (timestamps <= end)
+    return [log_entries[i] for i in np.flatnonzero(mask)]
+
+def filter_sorted_by_date_example(log_entries, start_date, end_date, timestamps=None):
+    """Filter log entries already in ascending timestamp order
+    
+    Entries loaded via Example 3 arrive sorted, so the date range is two
+    binary searches and a slice instead of a scan over every entry.
+    """
+    return filter_by_date_example(log_entries, start_date, end_date,
+                                  timestamps=timestamps, assume_sorted=True)
 
 # Usage:
 # from datetime import datetime, timedelta
 # start = datetime.now() - timedelta(days=7)  # Last 7 days
 # end = datetime.now()
 # filtered_logs = filter_by_date_example(log_entries, start, end)
+#
+# Entries from the database example are already in ascending order:
+# filtered_logs = filter_sorted_by_date_example(log_entries, start, end)
+#
+# Repeated filters over the same entries can reuse the timestamp index:
+# log_entries.sort(key=lambda e: e.timestamp)
+# timestamps = build_timestamp_index_example(log_entries)
+# filtered_logs = filter_by_date_example(log_entries, start, end,
+#                                        timestamps=timestamps, assume_sorted=True)
 
 # ===========================================
 # EXAMPLE 6: Email Report Notifications
@@ -188,9 +221,24 @@ def filter_by_date_example(log_entries, start_date, end_date):
 
 # Add email notification feature:
 
+_EMAIL_BODY_TEMPLATE = """
+    Log Analysis Report
+    
+    Generated: {generated}
+    Users Analyzed: {users}
+    Issues Found: {issues}
+    
+    Critical Issues: {critical}
+    Errors: {errors}
+    Warnings: {warnings}
+    
+    Please review the attached HTML report for details.
+    """
+
 def send_email_report_example(report, recipient_email):
     """Send report via email"""
     import smtplib
+    from collections import Counter
     from email.mime.text import MIMEText
     from email.mime.multipart import MIMEMultipart
     
@@ -200,20 +248,19 @@ def send_email_report_example(report, recipient_email):
     msg['From'] = 'loganalyzer@company.com'
     msg['To'] = recipient_email
     
-    # Create body
-    body = f"""
-    Log Analysis Report
-    
-    Generated: {report.generated_at}
-    Users Analyzed: {report.total_users_analyzed}
-    Issues Found: {len(report.issues)}
+    # Count all severities in a single pass over the issues
+    severity_counts = Counter(i.severity for i in report.issues)
+    stats = {
+        'generated': report.generated_at,
+        'users': report.total_users_analyzed,
+        'issues': len(report.issues),
+        'critical': severity_counts['Critical'],
+        'errors': severity_counts['Error'],
+        'warnings': severity_counts['Warning']
+    }
     
-    Critical Issues: {sum(1 for i in report.issues if i.severity == 'Critical')}
-    Errors: {sum(1 for i in report.issues if i.severity == 'Error')}
-    Warnings: {sum(1 for i in report.issues if i.severity == 'Warning')}
-    
-    Please review the attached HTML report for details.
-    """
+    # Create body
+    body = _EMAIL_BODY_TEMPLATE.format_map(stats)
     
     msg.attach(MIMEText(body, 'plain'))
     
@@ -231,21 +278,40 @@ def send_email_report_example(report, recipient_email):
 # Add continuous monitoring:
 
 def monitor_logs_realtime_example(interval_seconds=300):
-    """Monitor logs continuously"""
+    """Monitor logs continuously
+    
+    Scans are scheduled against a monotonic deadline, so the time spent
+    analyzing does not push later scans back. Each analysis runs on a
+    background worker; if one is still running when the next scan is due,
+    that scan is skipped rather than queued.
+    """
     import time
+    from concurrent.futures import ThreadPoolExecutor
     from datetime import datetime
     # Note: This is example code - you would need to import your actual LogAnalyzer
     # from main import LogAnalyzer
     
-    while True:
+    def run_analysis():
         print(f"\n[{datetime.now()}] Starting analysis...")
         
         # Run analysis (requires importing actual LogAnalyzer class)
         # analyzer = LogAnalyzer()
         # analyzer.run()
-        
-        print(f"Waiting {interval_seconds} seconds before next scan...")
-        time.sleep(interval_seconds)
+    
+    pending = None
+    deadline = time.monotonic()
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            if pending is None or pending.done():
+                pending = executor.submit(run_analysis)
+            else:
+                print("Previous analysis still running, skipping this scan")
+            
+            # Never schedule in the past if the process was suspended
+            deadline = max(deadline + interval_seconds, time.monotonic())
+            print(f"Waiting {interval_seconds} seconds before next scan...")
+            time.sleep(max(0.0, deadline - time.monotonic()))
 
 # Usage:
 # monitor_logs_realtime_example(interval_seconds=300)  # Every 5 minutes
@@ -256,16 +322,37 @@ def monitor_logs_realtime_example(interval_seconds=300):
 
 # Create tickets for critical issues:
 
-def create_tickets_example(issues):
-    """Create tickets for critical issues"""
-    import requests
-    
-    critical_issues = [i for i in issues if i.severity in ['Critical', 'Error']]
-    
-    for issue in critical_issues:
-        ticket_data = {
-            'title': f"{issue.category} - {issue.severity}",
-            'description': f"""
+_TICKET_SEVERITIES = frozenset(('Critical', 'Error'))
+_PRIORITY = {'Critical': 'high'}
+
+TICKETING_API_URL = 'https://your-ticketing-system.com/api/tickets'
+TICKETING_HEADERS = {'Authorization': 'Bearer YOUR_TOKEN'}
+TICKETING_MAX_WORKERS = 8
+
+_ticket_session = None
+
+def _get_ticket_session():
+    """Shared HTTP session so ticket posts reuse pooled keep-alive connections"""
+    global _ticket_session
+    if _ticket_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=TICKETING_MAX_WORKERS * 2,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _ticket_session = session
+    return _ticket_session
+
+def _build_ticket_payload(issue):
+    return {
+        'title': f"{issue.category} - {issue.severity}",
+        'description': f"""
             Issue ID: {issue.issue_id}
             Affected Users: {issue.user_count}
             Occurrences: {issue.occurrences}
@@ -276,16 +363,44 @@ def create_tickets_example(issues):
             Solution:
             {issue.solution}
             """,
-            'priority': 'high' if issue.severity == 'Critical' else 'medium',
-            'labels': [issue.category, issue.severity]
-        }
-        
-        # Send to ticketing system API
-        # response = requests.post(
-        #     'https://your-ticketing-system.com/api/tickets',
-        #     json=ticket_data,
-        #     headers={'Authorization': 'Bearer YOUR_TOKEN'}
-        # )
+        'priority': _PRIORITY.get(issue.severity, 'medium'),
+        'labels': [issue.category, issue.severity]
+    }
+
+def create_tickets_example(issues):
+    """Create tickets for critical issues
+    
+    Tickets are posted concurrently over one shared session, so the whole
+    batch takes roughly one round trip rather than one per ticket.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from config import TICKETING_ENABLED
+    
+    # Nothing is posted when ticketing is disabled, so skip building payloads
+    if not TICKETING_ENABLED:
+        return []
+    
+    ticket_payloads = [
+        _build_ticket_payload(i) for i in issues if i.severity in _TICKET_SEVERITIES
+    ]
+    if not ticket_payloads:
+        return []
+    
+    # If your ticketing system has a bulk endpoint, post ticket_payloads
+    # as a single JSON array instead
+    session = _get_ticket_session()
+    
+    def post_ticket(ticket_data):
+        return session.post(
+            TICKETING_API_URL,
+            json=ticket_data,
+            headers=TICKETING_HEADERS,
+            timeout=5
+        )
+    
+    # Send to ticketing system API
+    with ThreadPoolExecutor(max_workers=min(TICKETING_MAX_WORKERS, len(ticket_payloads))) as pool:
+        return list(pool.map(post_ticket, ticket_payloads))
 
 # ===========================================
 # EXAMPLE 9: Machine Learning Integration
@@ -320,41 +435,80 @@ def ml_classify_issue_example(log_entry):
 
 # Expose data via REST API for dashboard:
 
+REPORT_CACHE_TTL_SECONDS = 300
+_report_cache = {'body': None, 'etag': '', 'refreshed_at': 0.0}
+_report_cache_lock = threading.Lock()
+
+def _serialize_report_example(report):
+    """Serialize a report for the dashboard endpoint"""
+    import json
+    
+    return json.dumps({
+        'timestamp': report.generated_at.isoformat(),
+        'stats': {
+            'users': report.total_users_analyzed,
+            'systems': report.total_systems_analyzed,
+            'logs': report.total_logs_processed
+        },
+        'issues': [
+            {
+                'id': i.issue_id,
+                'category': i.category,
+                'severity': i.severity,
+                'user_count': i.user_count,
+                'occurrences': i.occurrences
+            }
+            for i in report.get_sorted_issues()
+        ]
+    })
+
 def create_api_endpoint_example():
-    """Create REST API for dashboard integration"""
-    from flask import Flask, jsonify
+    """Create REST API for dashboard integration
+    
+    The report is analyzed and serialized at most once per
+    REPORT_CACHE_TTL_SECONDS. Polls in between reuse the cached body, and
+    clients presenting a matching ETag get 304 Not Modified.
+    """
+    import hashlib
+    import time
+    from flask import Flask, Response, jsonify, request
     # Note: This is example code - you would need to import your actual LogAnalyzer
     # from main import LogAnalyzer
     
     app = Flask(__name__)
     
-    @app.route('/api/report/latest', methods=['GET'])
-    def get_latest_report():
+    def refresh_report():
         # Run analysis (requires importing actual LogAnalyzer class)
         # analyzer = LogAnalyzer()
         # report = analyzer.get_report()
+        report = None
+        
+        if report is not None:
+            _report_cache['body'] = _serialize_report_example(report)
+            _report_cache['etag'] = hashlib.blake2b(
+                report.generated_at.isoformat().encode(), digest_size=8
+            ).hexdigest()
+        _report_cache['refreshed_at'] = time.monotonic()
+    
+    @app.route('/api/report/latest', methods=['GET'])
+    def get_latest_report():
+        with _report_cache_lock:
+            if time.monotonic() - _report_cache['refreshed_at'] > REPORT_CACHE_TTL_SECONDS:
+                refresh_report()
+            body = _report_cache['body']
+            etag = _report_cache['etag']
         
-        # Example return structure (uncomment when using real report object):
-        # return jsonify({
-        #     'timestamp': report.generated_at.isoformat(),
-        #     'stats': {
-        #         'users': report.total_users_analyzed,
-        #         'systems': report.total_systems_analyzed,
-        #         'logs': report.total_logs_processed
-        #     },
-        #     'issues': [
-        #         {
-        #             'id': i.issue_id,
-        #             'category': i.category,
-        #             'severity': i.severity,
-        #             'user_count': i.user_count,
-        #             'occurrences': i.occurrences
-        #         }
-        #         for i in report.get_sorted_issues()
-        #     ]
-        # })
+        if body is None:
+            return jsonify({'status': 'example endpoint'})
         
-        return jsonify({'status': 'example endpoint'})
+        # set_etag quotes the tag and if_none_match parses the header's quoted
+        # list (and weak/* forms), so compare through them rather than by hand
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        return response
     
     # app.run(host='0.0.0.0', port=5000)
 
@@ -34,9 +34,33 @@ export const runAnalysis = async (settings) => {
     provider: settings.provider,
     auto_download: settings.autoDownload || false
   });
+  if (response.status === 202 && response.data.job_id) {
+    return waitForModelPull(response.data.job_id);
+  }
   return response.data;
 };
 
+const MODEL_PULL_POLL_MS = 3000;
+// Give up after an hour; large models can take a while to download
+const MODEL_PULL_MAX_POLLS = 1200;
+
+// Model downloads run server-side in the background; poll until the
+// pull-and-analyze job finishes and resolve with its analysis result
+const waitForModelPull = async (jobId) => {
+  for (let attempt = 0; attempt < MODEL_PULL_MAX_POLLS; attempt += 1) {
+    await new Promise((resolve) => setTimeout(resolve, MODEL_PULL_POLL_MS));
+    const response = await api.get(`/models/pull/${jobId}`);
+    const job = response.data;
+    if (job.status === 'completed') {
+      return job.result;
+    }
+    if (job.status === 'failed') {
+      throw new Error(job.error || 'Model download failed');
+    }
+  }
+  throw new Error('Model download timed out; check the Ollama server and try again');
+};
+
 export const fetchLatestReport = async () => {
   try {
     const response = await api.get('/reports/latest');
@@ -77,8 +101,12 @@ export const exportReport = async (format = 'json', reportType = 'General Report
     } else {
       // For other formats, expect JSON response
       console.log('Requesting JSON response for:', format);
+      // Rendered formats (HTML) always contain the full report
       const response = await api.post('/reports/export', { format });
       console.log('JSON response received:', response.data);
+      if (response.status === 202 && response.data.jobId) {
+        return waitForExportJob(response.data.jobId);
+      }
       return response.data;
     }
   } catch (error) {
@@ -94,4 +122,39 @@ export const exportReport = async (format = 'json', reportType = 'General Report
   }
 };
 
+const EXPORT_JOB_POLL_MS = 1000;
+const EXPORT_JOB_MAX_POLLS = 120;
+
+// Rendered formats are produced by a server-side background job; poll it and
+// download the file once it completes. The file is fetched as a blob and saved
+// through an anchor, since a popup opened after these waits is no longer tied
+// to the user's click and may be blocked.
+const waitForExportJob = async (jobId) => {
+  for (let attempt = 0; attempt < EXPORT_JOB_MAX_POLLS; attempt += 1) {
+    await new Promise((resolve) => setTimeout(resolve, EXPORT_JOB_POLL_MS));
+    const response = await api.get(`/reports/export/status/${jobId}`);
+    const job = response.data;
+    if (job.status === 'completed') {
+      const file = await api.get(`/reports/export/download/${jobId}`, { responseType: 'blob' });
+      saveBlob(file.data, job.filename);
+      return { success: true, filename: job.filename };
+    }
+    if (job.status === 'failed') {
+      return { success: false, error: job.error || 'Export failed' };
+    }
+  }
+  return { success: false, error: 'Export timed out; try again later' };
+};
+
+const saveBlob = (blob, filename) => {
+  const url = URL.createObjectURL(blob);
+  const link = document.createElement('a');
+  link.href = url;
+  link.download = filename;
+  document.body.appendChild(link);
+  link.click();
+  link.remove();
+  setTimeout(() => URL.revokeObjectURL(url), 0);
+};
+
 export default api;
@@ -1,3 +1,4 @@
+using System.Text.Json.Serialization;
 using Microsoft.AspNetCore.Mvc;
 
 namespace LogAnalyzerWeb.Controllers;
@@ -102,7 +103,14 @@ public class ProxyController : ControllerBase
             if (!response.IsSuccessStatusCode)
                 return StatusCode((int)response.StatusCode, content);
                 
-            return Content(content, "application/json");
+            // 202 means the model is being downloaded first; the body carries
+            // the job to poll through models/pull/{jobId}
+            return new ContentResult
+            {
+                Content = content,
+                ContentType = "application/json",
+                StatusCode = (int)response.StatusCode
+            };
         }
         catch (Exception ex)
         {
@@ -111,6 +119,27 @@ public class ProxyController : ControllerBase
         }
     }
 
+    [HttpGet("models/pull/{jobId}")]
+    public async Task<IActionResult> GetModelPullJob(string jobId)
+    {
+        try
+        {
+            var client = _httpClientFactory.CreateClient();
+            var response = await client.GetAsync($"{PythonApiBaseUrl}/api/models/pull/{Uri.EscapeDataString(jobId)}");
+            var content = await response.Content.ReadAsStringAsync();
+            
+            if (!response.IsSuccessStatusCode)
+                return StatusCode((int)response.StatusCode, content);
+                
+            return Content(content, "application/json");
+        }
+        catch (Exception ex)
+        {
+            _logger.LogError(ex, "Error fetching model pull job");
+            return StatusCode(500, new { error = ex.Message });
+        }
+    }
+
     [HttpGet("latest-report")]
     public async Task<IActionResult> GetLatestReport()
     {
@@ -133,9 +162,14 @@ public class ProxyController : ControllerBase
     }
 }
 
+// Field names follow the Python API's snake_case keys, both when binding the
+// client's request and when forwarding it with PostAsJsonAsync
 public class AnalysisRequest
 {
+    [JsonPropertyName("use_llm")]
     public bool UseLlm { get; set; }
     public string? Model { get; set; }
     public string? Provider { get; set; }
+    [JsonPropertyName("auto_download")]
+    public bool AutoDownload { get; set; }
 }
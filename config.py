@@ -24,6 +24,13 @@ LOG_TYPES = [
     "network_tcpip.log",
     "network_wlan.log"
 ]
+LOG_TYPES_SET = frozenset(LOG_TYPES)  # O(1) filename membership checks
+
+# Worker processes for parsing large log sets (0 = one per CPU)
+PARSE_MAX_WORKERS = int(os.environ.get("LOG_ANALYZER_PARSE_WORKERS", "0"))
+
+# Parsed sessions kept in memory for reuse while their files are unchanged (0 = disabled)
+PARSE_CACHE_MAX_SESSIONS = int(os.environ.get("LOG_ANALYZER_PARSE_CACHE_SESSIONS", "64"))
 
 NETWORK_LOG_KEYWORDS = [
     "network",
@@ -57,6 +64,13 @@ REPORT_FORMAT = "both"  # Options: "console", "html", "json", "both"
 MIN_SIMILARITY_SCORE = 0.7  # Minimum similarity to group issues together
 MIN_USER_THRESHOLD = 1  # Minimum users affected to report an issue
 
+# Request profiling (development only): "1" profiles every API request, "header" only
+# requests sent with "X-Profile-Request: 1"; cProfile dumps go to logs/profile
+PROFILE_MODE = os.environ.get("LOG_ANALYZER_PROFILE", "").lower()
+
+# Ticketing integration (see EXTENSIONS_EXAMPLES.py, Example 8)
+TICKETING_ENABLED = os.environ.get("LOG_ANALYZER_TICKETING", "false").lower() == "true"
+
 # LLM Configuration
 LLM_ENABLED = True  # Enable/disable LLM analysis
 LLM_PROVIDER = "ollama"  # Options: "ollama", "lmstudio", "openai", "azure"
@@ -65,6 +79,10 @@ LLM_ONLY_ANALYSIS = os.environ.get("LOG_ANALYZER_LLM_ONLY", "true").lower() == "
 LLM_FALLBACK_TO_PATTERNS = False  # Disabled to enforce strict LLM-only analysis
 LLM_REQUEST_TIMEOUT_SECONDS = int(os.environ.get("LOG_ANALYZER_LLM_TIMEOUT", "180"))
 LLM_MAX_RETRIES = int(os.environ.get("LOG_ANALYZER_LLM_RETRIES", "3"))
+LLM_MAX_CONCURRENCY = int(os.environ.get("LOG_ANALYZER_LLM_CONCURRENCY", "4"))  # Parallel issue-group requests
+LLM_CACHE_ENABLED = os.environ.get("LOG_ANALYZER_LLM_CACHE", "true").lower() == "true"
+LLM_CACHE_PATH = os.environ.get("LOG_ANALYZER_LLM_CACHE_PATH", os.path.join(BASE_DIR, "logs", "llm_cache.sqlite3"))
+LLM_CACHE_TTL_SECONDS = int(os.environ.get("LOG_ANALYZER_LLM_CACHE_TTL", str(7 * 24 * 3600)))
 
 # Available LLM Providers
 LLM_PROVIDERS = {
@@ -34,10 +34,10 @@ class FileSystemDataSource(DataSource):
     
     def get_log_entries(self, **kwargs) -> List[LogEntry]:
         """Read log entries from filesystem"""
-        logger.info(f'Retrieving log entries from {self.base_logs_dir}')
-        logger.info(f'Log types to retrieve: {self.log_types}')
+        logger.info('Retrieving log entries from %s', self.base_logs_dir)
+        logger.info('Log types to retrieve: %s', self.log_types)
         entries = self.log_parser.parse_all_logs(self.base_logs_dir, self.log_types)
-        logger.info(f'Retrieved {len(entries)} log entries')
+        logger.info('Retrieved %d log entries', len(entries))
         return entries
     
     def get_statistics(self) -> dict:
@@ -54,7 +54,8 @@ class FileSystemDataSource(DataSource):
             "source_type": "filesystem",
             "base_directory": self.base_logs_dir
         }
-        logger.info(f'Filesystem stats: {len(discovered)} sessions, {len(unique_users)} users, {len(unique_systems)} systems')
+        logger.info('Filesystem stats: %d sessions, %d users, %d systems',
+                    len(discovered), len(unique_users), len(unique_systems))
         return stats
 
 
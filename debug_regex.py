@@ -2,6 +2,40 @@
 """Debug the regex matching"""
 import re
 
+# Header lines of an event block, keyed by their prefix
+EVENT_FIELDS = (
+    ('Time:', 'time'),
+    ('Level:', 'level'),
+    ('Source:', 'source'),
+    ('Event ID:', 'event_id'),
+    ('Category:', 'category'),
+)
+
+def parse_event_lines(event_text):
+    """Reference parser for one event block: a single pass over its lines,
+    dispatching on each line's prefix instead of backtracking through
+    optional regex groups"""
+    lines = event_text.splitlines()
+    match = re.match(r'Event #(\d+)', lines[0]) if lines else None
+    if not match:
+        return {}
+
+    fields = {'event_number': match.group(1)}
+    for index, line in enumerate(lines[1:], 1):
+        if line.startswith('Message:'):
+            message_lines = [line[len('Message:'):]]
+            for message_line in lines[index + 1:]:
+                if message_line.startswith(('====', 'Event #')):
+                    break
+                message_lines.append(message_line)
+            fields['message'] = '\n'.join(message_lines).strip()
+            break
+        for prefix, key in EVENT_FIELDS:
+            if line.startswith(prefix):
+                fields[key] = line[len(prefix):].strip()
+                break
+    return fields
+
 with open('analysis_logs/10669022/soc-5CG5233YBT/2026-01-26_12-13-30/system_logs.txt', 'r') as f:
     content = f.read()
 
@@ -36,3 +70,7 @@ for name, pattern_str in patterns:
     except Exception as e:
         print(f'{name}: ERROR - {e}')
     print()
+
+print('Line parser:')
+for key, value in parse_event_lines(first_event_text).items():
+    print(f'    {key}: {repr(value[:60])}')
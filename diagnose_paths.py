@@ -5,6 +5,13 @@ import sys
 
 BASE_DIR = r'C:\Work\SystemLogAnalyzer\SystemLogAnalyzer\analysis_logs'
 
+
+def list_entries(path):
+    """Return (name, full path, is_dir) for each child of path from a single directory scan"""
+    with os.scandir(path) as entries:
+        return [(entry.name, entry.path, entry.is_dir()) for entry in entries]
+
+
 print("="*80)
 print("PATH READING DIAGNOSTIC")
 print("="*80)
@@ -16,12 +23,12 @@ print()
 # Level 1: User directories
 print("LEVEL 1 - User IDs:")
 try:
-    user_ids = os.listdir(BASE_DIR)
+    user_entries = list_entries(BASE_DIR)
+    user_ids = [uid for uid, _, _ in user_entries]
     print(f"  Found {len(user_ids)} items:")
-    for uid in user_ids:
-        uid_path = os.path.join(BASE_DIR, uid)
+    for uid, uid_path, uid_is_dir in user_entries:
         print(f"    - {uid}")
-        print(f"      Type: {'DIR' if os.path.isdir(uid_path) else 'FILE'}")
+        print(f"      Type: {'DIR' if uid_is_dir else 'FILE'}")
         print(f"      Full path: {uid_path}")
         print(f"      Path repr: {repr(uid_path)}")
 except Exception as e:
@@ -29,40 +36,35 @@ except Exception as e:
 
 # Level 2: System names
 print("\nLEVEL 2 - System Names:")
-for user_id in user_ids:
-    user_path = os.path.join(BASE_DIR, user_id)
-    if os.path.isdir(user_path):
+for user_id, user_path, user_is_dir in user_entries:
+    if user_is_dir:
         try:
-            systems = os.listdir(user_path)
+            systems = list_entries(user_path)
             print(f"  User '{user_id}' has {len(systems)} system entries:")
-            for sys in systems:
-                sys_path = os.path.join(user_path, sys)
-                print(f"    - {sys}")
-                print(f"      Type: {'DIR' if os.path.isdir(sys_path) else 'FILE'}")
+            for system, sys_path, sys_is_dir in systems:
+                print(f"    - {system}")
+                print(f"      Type: {'DIR' if sys_is_dir else 'FILE'}")
                 print(f"      Full path: {sys_path}")
         except Exception as e:
             print(f"  ERROR reading {user_path}: {e}")
 
 # Level 3: Session timestamps
 print("\nLEVEL 3 - Session Timestamps (with date-time format):")
-for user_id in user_ids:
-    user_path = os.path.join(BASE_DIR, user_id)
-    if os.path.isdir(user_path):
-        for system_name in os.listdir(user_path):
-            sys_path = os.path.join(user_path, system_name)
-            if os.path.isdir(sys_path):
+for user_id, user_path, user_is_dir in user_entries:
+    if user_is_dir:
+        for system_name, sys_path, sys_is_dir in list_entries(user_path):
+            if sys_is_dir:
                 try:
-                    sessions = os.listdir(sys_path)
+                    sessions = list_entries(sys_path)
                     print(f"  System '{system_name}' has {len(sessions)} session entries:")
-                    for session in sessions:
-                        session_path = os.path.join(sys_path, session)
+                    for session, session_path, session_is_dir in sessions:
                         print(f"    - {session}")
-                        print(f"      Type: {'DIR' if os.path.isdir(session_path) else 'FILE'}")
+                        print(f"      Type: {'DIR' if session_is_dir else 'FILE'}")
                         print(f"      Full path: {session_path}")
                         print(f"      Path repr: {repr(session_path)}")
                         
                         # Try to read from this path
-                        if os.path.isdir(session_path):
+                        if session_is_dir:
                             try:
                                 files = os.listdir(session_path)
                                 print(f"      Can read: YES ({len(files)} files)")
@@ -6,6 +6,7 @@ Supports multiple parsing strategies:
 3. Pure Python fallback parsing
 """
 import os
+import re
 import sys
 import logging
 from datetime import datetime
@@ -14,6 +15,76 @@ from models import LogEntry
 
 logger = logging.getLogger('log_analyzer.parser')
 
+# Record XML field patterns, compiled once for every record parsed. Matching is
+# exact-case, like XML element names: each search is gated on its literal tag
+_EVENT_ID_RE = re.compile(r'<EventID>(\d+)</EventID>')
+_LEVEL_NUMBER_RE = re.compile(r'<Level>(\d+)</Level>')
+_LEVEL_TEXT_RE = re.compile(r'<Level>(\w+)</Level>')
+_PROVIDER_RE = re.compile(r'<Provider\s+[^>]*Name="([^"]+)"')
+_CHANNEL_RE = re.compile(r'<Channel>([^<]+)</Channel>')
+_SYSTEM_TIME_RE = re.compile(r'<SystemTime>([^<]+)</SystemTime>')
+# Named and unnamed <Data> elements in one scan: group 1 is the Name (None when unnamed)
+_DATA_RE = re.compile(r'<Data(?:\s+Name="([^"]+)")?>([^<]*)</Data>')
+
+# An EVTX file starts with a 4096-byte file header whose first 8 bytes are this signature
+EVTX_FILE_SIGNATURE = b'ElfFile\x00'
+EVTX_FILE_HEADER_SIZE = 4096
+
+
+def _has_evtx_header(file_path: str, file_size: int) -> bool:
+    """Cheap pre-check that a file is large enough and carries the EVTX signature"""
+    if file_size < EVTX_FILE_HEADER_SIZE:
+        return False
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read(len(EVTX_FILE_SIGNATURE)) == EVTX_FILE_SIGNATURE
+    except OSError:
+        return False
+
+
+def _find_provider_name(xml_string: str):
+    """Return the Provider element's Name attribute, or None if there isn't one
+
+    Slices the attribute out with str.find instead of running _PROVIDER_RE, whose
+    greedy [^>]* backtracks over the whole element. Like the regex, it takes the
+    last Name=" in the element; anything unusual falls back to the regex.
+    """
+    start = xml_string.find('<Provider')
+    if start < 0:
+        return None
+    end = xml_string.find('>', start)
+    name_at = xml_string.rfind('Name="', start + 10, end if end >= 0 else len(xml_string))
+    if name_at >= 0 and xml_string[start + 9:start + 10].isspace():
+        value_end = xml_string.find('"', name_at + 6)
+        if value_end > name_at + 6:
+            return xml_string[name_at + 6:value_end]
+    match = _PROVIDER_RE.search(xml_string)
+    return match.group(1) if match else None
+
+
+# From Python 3.11 fromisoformat accepts a trailing 'Z' and any number of fractional digits
+_FROMISOFORMAT_IS_LENIENT = sys.version_info >= (3, 11)
+
+
+def _normalize_system_time(timestamp_str: str) -> str:
+    """Rewrite a SystemTime value into the stricter pre-3.11 fromisoformat form"""
+    utc = timestamp_str.endswith('Z')
+    if utc:
+        timestamp_str = timestamp_str[:-1]
+    seconds, dot, fraction = timestamp_str.partition('.')
+    if dot and fraction.isdigit():
+        timestamp_str = f"{seconds}.{fraction[:6].ljust(6, '0')}"
+    return timestamp_str + '+00:00' if utc else timestamp_str
+
+
+LEVEL_NAMES = {
+    1: "Critical",
+    2: "Error",
+    3: "Warning",
+    4: "Information",
+    5: "Verbose"
+}
+
 # Try different EVTX parsing libraries in order of preference
 PYEVTX_AVAILABLE = False
 SIMPLE_PARSER_AVAILABLE = False
@@ -56,39 +127,47 @@ class EvtxParser:
         """Parse a single .evtx file and extract all events"""
         log_entries = []
         
-        if not os.path.exists(file_path):
-            logger.warning(f"EVTX file not found: {file_path}")
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
+            logger.warning("EVTX file not found: %s", file_path)
             return log_entries
         
-        logger.info(f"EvtxParser.parse_evtx_file called for {os.path.basename(file_path)}")
+        if file_size == 0:
+            logger.warning("EVTX file is empty: %s", file_path)
+            return log_entries
         
-        # Try pyevtx first if available
-        if self.pyevtx_available:
+        file_name = os.path.basename(file_path)
+        log_type = file_name[:-len(".evtx")] if file_name.endswith(".evtx") else file_name
+        logger.info("EvtxParser.parse_evtx_file called for %s", file_name)
+        
+        # Try pyevtx first if available; files without the EVTX file header would only
+        # fail inside it, so they go straight to the fallback parser
+        if self.pyevtx_available and _has_evtx_header(file_path, file_size):
             try:
-                logger.info(f"Attempting pyevtx parsing for {os.path.basename(file_path)}")
-                entries = self._parse_with_pyevtx(file_path, user_id, system_name, session_timestamp)
-                logger.info(f"pyevtx successfully parsed {len(entries)} entries")
+                logger.info("Attempting pyevtx parsing for %s", file_name)
+                entries = self._parse_with_pyevtx(file_path, user_id, system_name, session_timestamp, log_type)
+                logger.info("pyevtx successfully parsed %d entries", len(entries))
                 return entries
             except Exception as e:
-                logger.info(f"pyevtx parsing failed: {e}. Trying fallback parser...")
+                logger.info("pyevtx parsing failed: %s. Trying fallback parser...", e)
         
         # Fall back to simple parser
         if self.simple_parser:
             try:
-                logger.info(f"Attempting simple parser for {os.path.basename(file_path)}")
+                logger.info("Attempting simple parser for %s", file_name)
                 entries = self.simple_parser.parse_evtx_file(file_path, user_id, system_name, session_timestamp)
-                logger.info(f"Simple parser returned {len(entries)} entries")
+                logger.info("Simple parser returned %d entries", len(entries))
                 return entries
             except Exception as e:
-                logger.error(f"Simple parser failed: {e}", exc_info=True)
+                logger.error("Simple parser failed: %s", e, exc_info=True)
         
-        logger.warning(f"Could not parse EVTX file {file_path}")
+        logger.warning("Could not parse EVTX file %s", file_path)
         return log_entries
     
-    def _parse_with_pyevtx(self, file_path: str, user_id: str, system_name: str, session_timestamp: str) -> List[LogEntry]:
+    def _parse_with_pyevtx(self, file_path: str, user_id: str, system_name: str, session_timestamp: str, log_type: str) -> List[LogEntry]:
         """Parse using libevtx library (pyevtx)"""
         log_entries = []
-        log_type = os.path.basename(file_path).replace(".evtx", "")
         
         try:
             # libevtx-python uses a different API
@@ -96,155 +175,122 @@ class EvtxParser:
             evtx_file.open(file_path)
             
             if evtx_file is None:
-                print(f"Error: Could not open EVTX file {file_path}")
+                logger.warning("Could not open EVTX file %s", file_path)
                 return log_entries
             
-            # Iterate through all records
-            number_of_records = evtx_file.number_of_records
-            for record_index in range(number_of_records):
-                try:
-                    record = evtx_file.get_record(record_index)
-                    
-                    # Extract event information
-                    event_id = self._get_event_id(record)
-                    level = self._get_level(record)
-                    source = self._get_source(record)
-                    timestamp = self._get_timestamp(record)
-                    message = self._get_message(record)
-                    
-                    log_entry = LogEntry(
-                        event_number=record_index,
-                        level=level,
-                        source=source,
-                        event_id=event_id,
-                        timestamp=timestamp,
-                        message=message,
-                        log_type=log_type,
-                        user_id=user_id,
-                        system_name=system_name,
-                        session_timestamp=session_timestamp
-                    )
-                    log_entries.append(log_entry)
-                    
-                except Exception as e:
-                    print(f"Error parsing event {record_index} in {file_path}: {e}")
-                    continue
-            
-            evtx_file.close()
+            try:
+                # Stream records sequentially rather than resolving each by index
+                records = iter(evtx_file.records)
+                for record_index in range(evtx_file.number_of_records):
+                    try:
+                        if records is not None:
+                            try:
+                                record = next(records)
+                            except Exception:
+                                # pyevtx's iterator does not step past a record it failed
+                                # to read; resolve this and the remaining records by index
+                                records = None
+                        if records is None:
+                            record = evtx_file.get_record(record_index)
+                        
+                        # xml_string is rebuilt by libevtx on every access; read it once
+                        try:
+                            xml_string = record.xml_string
+                        except Exception:
+                            xml_string = None
+                        
+                        # Extract event information
+                        event_id, level, source, timestamp, message = self._parse_record_xml(xml_string)
+                        
+                        # Positional arguments, in LogEntry field order
+                        log_entry = LogEntry(
+                            record_index, level, source, event_id, timestamp, message,
+                            log_type, user_id, system_name, session_timestamp
+                        )
+                        log_entries.append(log_entry)
+                        
+                    except Exception as e:
+                        logger.debug("Error parsing event %d in %s: %s", record_index, file_path, e)
+                        continue
+            finally:
+                evtx_file.close()
             
         except Exception as e:
-            print(f"Error reading EVTX file {file_path}: {e}")
+            logger.warning("Error reading EVTX file %s: %s", file_path, e)
         
         return log_entries
     
-    def _get_event_id(self, record) -> int:
-        """Extract Event ID from record"""
-        try:
-            # Try to get from XML data
-            xml_string = record.xml_string
-            # Parse Event ID from XML: <EventID>4042</EventID>
-            import re
-            match = re.search(r'<EventID>(\d+)</EventID>', xml_string, re.IGNORECASE)
-            if match:
-                return int(match.group(1))
-            return 0
-        except:
-            return 0
-    
-    def _get_level(self, record) -> str:
-        """Extract Event Level from record"""
-        try:
-            xml_string = record.xml_string
-            # Parse Level from XML: <Level>2</Level> or <Level>Error</Level>
-            import re
-            
-            # Try numeric level first
-            match = re.search(r'<Level>(\d+)</Level>', xml_string, re.IGNORECASE)
-            if match:
-                level_num = int(match.group(1))
-                level_map = {
-                    1: "Critical",
-                    2: "Error",
-                    3: "Warning",
-                    4: "Information",
-                    5: "Verbose"
-                }
-                return level_map.get(level_num, "Information")
-            
-            # Try text level
-            match = re.search(r'<Level>(\w+)</Level>', xml_string, re.IGNORECASE)
+    def _parse_record_xml(self, xml_string):
+        """Extract (event_id, level, source, timestamp, message) from record XML"""
+        if xml_string is None:
+            return 0, "Information", "Unknown", datetime.now(), "Unable to parse message"
+        
+        # Each search is gated on its literal tag: a substring test is far cheaper
+        # than a case-insensitive regex scan of a record that lacks the element
+        
+        # Parse Event ID from XML: <EventID>4042</EventID>
+        match = _EVENT_ID_RE.search(xml_string) if '<EventID>' in xml_string else None
+        event_id = int(match.group(1)) if match else 0
+        
+        # Parse Level from XML: <Level>2</Level> or <Level>Error</Level>
+        level = "Information"
+        if '<Level>' in xml_string:
+            match = _LEVEL_NUMBER_RE.search(xml_string)
             if match:
-                return match.group(1)
-            
-            return "Information"
-        except:
-            return "Information"
+                level = LEVEL_NAMES.get(int(match.group(1)), "Information")
+            else:
+                match = _LEVEL_TEXT_RE.search(xml_string)
+                if match:
+                    level = match.group(1)
+        
+        # Parse Provider from XML: <Provider Name="Microsoft-Windows-NCSI" ... />, else the Channel
+        source = _find_provider_name(xml_string)
+        if source is None:
+            match = _CHANNEL_RE.search(xml_string) if '<Channel>' in xml_string else None
+            source = match.group(1) if match else "Unknown"
+        
+        # Parse SystemTime from XML: <SystemTime>2024-01-15T10:30:45.123456Z</SystemTime>
+        match = _SYSTEM_TIME_RE.search(xml_string) if '<SystemTime>' in xml_string else None
+        timestamp = self._parse_system_time(match.group(1)) if match else datetime.now()
+        
+        return event_id, level, source, timestamp, self._build_message(xml_string)
     
-    def _get_source(self, record) -> str:
-        """Extract Source/Provider from record"""
+    def _parse_system_time(self, timestamp_str) -> datetime:
+        """Parse an ISO 8601 SystemTime value: 2024-01-15T10:30:45.1234567Z"""
+        if not _FROMISOFORMAT_IS_LENIENT:
+            timestamp_str = _normalize_system_time(timestamp_str)
         try:
-            xml_string = record.xml_string
-            # Parse Provider from XML: <Provider Name="Microsoft-Windows-NCSI" ... />
-            import re
-            match = re.search(r'<Provider\s+[^>]*Name="([^"]+)"', xml_string, re.IGNORECASE)
-            if match:
-                return match.group(1)
-            
-            # Fallback to Channel
-            match = re.search(r'<Channel>([^<]+)</Channel>', xml_string, re.IGNORECASE)
-            if match:
-                return match.group(1)
-            
-            return "Unknown"
-        except:
-            return "Unknown"
-    
-    def _get_timestamp(self, record) -> datetime:
-        """Extract timestamp from record"""
+            return datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            pass
         try:
-            xml_string = record.xml_string
-            # Parse SystemTime from XML: <SystemTime>2024-01-15T10:30:45.123456Z</SystemTime>
-            import re
-            match = re.search(r'<SystemTime>([^<]+)</SystemTime>', xml_string, re.IGNORECASE)
-            if match:
-                timestamp_str = match.group(1)
-                # Parse ISO 8601 format: 2024-01-15T10:30:45.123456Z
-                try:
-                    return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                except:
-                    # Fallback to simpler parsing
-                    return datetime.strptime(timestamp_str[:19], "%Y-%m-%dT%H:%M:%S")
-            
-            return datetime.now()
-        except:
+            # Fall back to the date and time of day, ignoring whatever follows the seconds
+            return datetime.fromisoformat(timestamp_str[:19])
+        except ValueError:
             return datetime.now()
     
-    def _get_message(self, record) -> str:
-        """Extract message from record"""
-        try:
-            xml_string = record.xml_string
-            
-            # Try to get EventData values first
-            import re
-            message_parts = []
-            
-            # Extract Data elements with Name attribute
-            data_matches = re.findall(r'<Data\s+Name="([^"]+)">([^<]*)</Data>', xml_string, re.IGNORECASE)
-            if data_matches:
-                for name, value in data_matches:
-                    if value:
-                        message_parts.append(f"{name}: {value}")
-            
-            # Also try unnamed Data elements
-            data_matches = re.findall(r'<Data>([^<]+)</Data>', xml_string, re.IGNORECASE)
-            for value in data_matches:
-                if value and value not in [part.split(": ")[1] for part in message_parts]:
-                    message_parts.append(value)
-            
-            if message_parts:
-                return " | ".join(message_parts)
-            
-            # Fallback to full XML if no structured data
-            return xml_string[:500]  # First 500 chars
-        except:
-            return "Unable to parse message"
+    def _build_message(self, xml_string) -> str:
+        """Join EventData values: named elements first, then unnamed values not already listed"""
+        message_parts = []
+        unnamed_values = []
+        seen_values = set()
+        data_items = _DATA_RE.findall(xml_string) if '<Data' in xml_string else ()
+        for name, value in data_items:
+            if not value:
+                continue
+            if name:
+                message_parts.append(f"{name}: {value}")
+                seen_values.add(value)
+            else:
+                unnamed_values.append(value)
+        
+        for value in unnamed_values:
+            if value not in seen_values:
+                message_parts.append(value)
+                seen_values.add(value)
+        
+        if message_parts:
+            return " | ".join(message_parts)
+        
+        # Fallback to full XML if no structured data
+        return xml_string[:500]  # First 500 chars
@@ -6,6 +6,51 @@ Helps identify why files aren't being parsed correctly
 import os
 import sys
 import re
+import mmap
+
+def _utf16(text):
+    """Regex for an ASCII literal as it appears in UTF-16LE text"""
+    return re.escape(text.encode('utf-16-le'))
+
+def _utf16_not(char):
+    """Regex for one UTF-16LE code unit other than the ASCII char"""
+    return rb'(?:[^' + re.escape(char.encode('ascii')) + rb']\x00|[\x00-\xff][^\x00])'
+
+_UTF16_DIGIT = rb'[0-9]\x00'
+_UTF16_SPACE = rb'[ \t\r\n]\x00'
+
+# XML patterns as UTF-16LE byte regexes, searched in the mapped file directly so
+# text at any byte offset matches and nothing is decoded or copied up front
+XML_PATTERNS = [(name, re.compile(pattern, re.IGNORECASE)) for name, pattern in (
+    ('SystemTime', _utf16('<SystemTime>') + rb'(?:' + _utf16_not('<') + rb')+' + _utf16('</SystemTime>')),
+    ('EventID', _utf16('<EventID>') + rb'(?:' + _UTF16_DIGIT + rb')+' + _utf16('</EventID>')),
+    ('Level', _utf16('<Level>') + rb'(?:(?:' + _UTF16_DIGIT + rb')+|'
+        + rb'|'.join(_utf16(name) for name in ('Critical', 'Error', 'Warning', 'Information', 'Verbose'))
+        + rb')' + _utf16('</Level>')),
+    ('Provider', _utf16('<Provider') + rb'(?:' + _UTF16_SPACE + rb')+(?:' + _utf16_not('>') + rb')*'
+        + _utf16('Name="') + rb'(?:' + _utf16_not('"') + rb')+' + _utf16('"')),
+    ('Event elements', _utf16('<Event') + rb'(?:' + _utf16_not('>') + rb')*' + _utf16('>')),
+    ('Any XML tags', _utf16('<') + rb'(?:' + _utf16_not('>') + rb')+' + _utf16('>')),
+)]
+
+# Null bytes are counted over slices of this size so the mapped file is never copied whole
+NULL_COUNT_BLOCK_SIZE = 1 << 20
+
+def count_occurrences(buffer, needle):
+    """Count non-overlapping occurrences of needle in a bytes or mmap buffer"""
+    count = 0
+    position = buffer.find(needle)
+    while position >= 0:
+        count += 1
+        position = buffer.find(needle, position + len(needle))
+    return count
+
+def count_null_bytes(buffer):
+    """Count zero bytes in a bytes or mmap buffer one block at a time"""
+    return sum(
+        buffer[start:start + NULL_COUNT_BLOCK_SIZE].count(b'\x00')
+        for start in range(0, len(buffer), NULL_COUNT_BLOCK_SIZE)
+    )
 
 def inspect_evtx_file(file_path):
     """Inspect an EVTX file to understand its structure"""
@@ -21,8 +66,21 @@ def inspect_evtx_file(file_path):
     print(f"File: {file_path}")
     print(f"Size: {file_size:,} bytes")
     
+    if file_size == 0:
+        print("File is empty")
+        return
+    
+    # Map the file instead of reading it into memory; slices and searches below
+    # only touch the pages they need
     with open(file_path, 'rb') as f:
-        content = f.read()
+        content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        _report(content)
+    finally:
+        content.close()
+
+def _report(content):
+    """Print the header, decoding, pattern and structure sections for a mapped file"""
     
     # Check file header
     print(f"\nFile Header (first 100 bytes):")
@@ -36,7 +94,7 @@ def inspect_evtx_file(file_path):
     
     for encoding in ['utf-16-le', 'utf-8', 'latin-1', 'utf-16-be']:
         try:
-            decoded = content.decode(encoding, errors='ignore')
+            decoded = str(content, encoding, 'ignore')
             print(f"\n✓ {encoding}: Success - {len(decoded)} characters")
             
             # Look for XML patterns
@@ -54,30 +112,12 @@ def inspect_evtx_file(file_path):
     print(f"Pattern Search:")
     print(f"{'='*70}")
     
-    # Try UTF-16LE as primary
-    try:
-        text = content.decode('utf-16-le', errors='ignore')
-    except:
-        try:
-            text = content.decode('utf-8', errors='ignore')
-        except:
-            text = content.decode('latin-1', errors='ignore')
-    
-    patterns = {
-        'SystemTime': r'<SystemTime>([^<]+)</SystemTime>',
-        'EventID': r'<EventID>(\d+)</EventID>',
-        'Level': r'<Level>(\d+|Critical|Error|Warning|Information|Verbose)</Level>',
-        'Provider': r'<Provider\s+[^>]*Name="([^"]+)"',
-        'Event elements': r'<Event[^>]*>',
-        'Any XML tags': r'<[^>]+>',
-    }
-    
-    for pattern_name, pattern_str in patterns.items():
-        matches = list(re.finditer(pattern_str, text, re.IGNORECASE))
+    for pattern_name, pattern in XML_PATTERNS:
+        matches = list(pattern.finditer(content))
         print(f"\n{pattern_name}: {len(matches)} matches")
         if matches:
             for i, match in enumerate(matches[:3]):  # Show first 3
-                print(f"  Match {i+1}: {match.group()[:80]}")
+                print(f"  Match {i+1}: {match.group().decode('utf-16-le', 'replace')[:80]}")
                 if i >= 2:
                     if len(matches) > 3:
                         print(f"  ... and {len(matches)-3} more")
@@ -88,20 +128,20 @@ def inspect_evtx_file(file_path):
     print(f"File Structure Analysis:")
     print(f"{'='*70}")
     
-    null_count = content.count(b'\x00')
+    null_count = count_null_bytes(content)
     print(f"Null bytes: {null_count:,} ({100*null_count/len(content):.1f}%)")
     
     # Look for record separators or markers
     markers = {
         b'ElfChnk': 'ElfChnk (EVTX chunk marker)',
         b'ElfFile': 'ElfFile (EVTX file marker)',
-        b'Event>': 'Event closing tag',
-        b'<Event': 'Event opening tag',
+        'Event>'.encode('utf-16-le'): 'Event closing tag (UTF-16LE)',
+        '<Event'.encode('utf-16-le'): 'Event opening tag (UTF-16LE)',
     }
     
     print(f"\nSpecial markers found:")
     for marker, desc in markers.items():
-        count = content.count(marker)
+        count = count_occurrences(content, marker)
         print(f"  {desc}: {count} occurrences")
     
     print(f"\n{'='*70}\n")
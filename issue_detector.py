@@ -19,6 +19,27 @@ class IssueDetector:
     def __init__(self, similarity_threshold: float = 0.7):
         self.similarity_threshold = similarity_threshold
         self.issue_patterns = self._load_issue_patterns()
+        self._compile_issue_patterns()
+    
+    def _compile_issue_patterns(self):
+        """
+        Precompile the issue patterns once per detector.
+        The combined alternation lets _categorize_issue skip every
+        per-pattern regex search when no pattern can match a message.
+        """
+        self._compiled_patterns = [
+            re.compile(pattern_def["pattern"], re.IGNORECASE)
+            for pattern_def in self.issue_patterns
+        ]
+        self._combined_pattern = re.compile(
+            "|".join(f"(?:{pattern_def['pattern']})"
+                     for pattern_def in self.issue_patterns),
+            re.IGNORECASE
+        )
+        self._pattern_keywords = [
+            [kw.lower() for kw in pattern_def["keywords"]]
+            for pattern_def in self.issue_patterns
+        ]
     
     def _load_issue_patterns(self) -> List[Dict]:
         """
@@ -292,10 +313,19 @@ class IssueDetector:
         source_lower = entry.source.lower()
         log_type_lower = entry.log_type.lower()
         
+        # One scan with the combined pattern rules out all regex checks below
+        any_pattern_matches = self._combined_pattern.search(message_lower) is not None
+        
+        # Event ID digits are the same for every pattern
+        event_match = re.search(r'(\d+)', str(entry.event_id))
+        event_id_phrase = f"event id {event_match.group(1)}" if event_match else None
+        
         # Check against known patterns
-        for pattern_def in self.issue_patterns:
+        for pattern_def, compiled, keywords in zip(self.issue_patterns,
+                                                   self._compiled_patterns,
+                                                   self._pattern_keywords):
             # Check pattern against message
-            if re.search(pattern_def["pattern"], message_lower, re.IGNORECASE):
+            if any_pattern_matches and compiled.search(message_lower):
                 return (
                     pattern_def["category"],
                     pattern_def["root_cause"],
@@ -304,7 +334,7 @@ class IssueDetector:
                 )
             
             # Check keywords in message
-            keyword_matches = sum(1 for kw in pattern_def["keywords"] if kw.lower() in message_lower)
+            keyword_matches = sum(1 for kw in keywords if kw in message_lower)
             if keyword_matches >= 2:  # At least 2 keywords match
                 return (
                     pattern_def["category"],
@@ -314,23 +344,18 @@ class IssueDetector:
                 )
             
             # Also check event ID and source for network patterns
-            event_pattern = r'(\d+)'
-            event_match = re.search(event_pattern, str(entry.event_id))
-            if event_match:
-                event_id_str = event_match.group(1)
-                pattern_str = pattern_def["pattern"]
-                # Check if pattern mentions specific event IDs
-                if f"event id {event_id_str}" in pattern_str:
-                    return (
-                        pattern_def["category"],
-                        pattern_def["root_cause"],
-                        pattern_def["solution"],
-                        pattern_def.get("severity")
-                    )
+            # Check if pattern mentions specific event IDs
+            if event_id_phrase and event_id_phrase in pattern_def["pattern"]:
+                return (
+                    pattern_def["category"],
+                    pattern_def["root_cause"],
+                    pattern_def["solution"],
+                    pattern_def.get("severity")
+                )
             
             # Check keywords in source/log_type
-            keyword_matches_source = sum(1 for kw in pattern_def["keywords"] 
-                                        if kw.lower() in source_lower or kw.lower() in log_type_lower)
+            keyword_matches_source = sum(1 for kw in keywords 
+                                        if kw in source_lower or kw in log_type_lower)
             if keyword_matches_source >= 2:
                 return (
                     pattern_def["category"],
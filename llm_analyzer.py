@@ -13,6 +13,9 @@ from config import LLM_REQUEST_TIMEOUT_SECONDS, LLM_MAX_RETRIES
 
 logger = logging.getLogger('log_analyzer.llm')
 
+# Title used for the placeholder result returned when group analysis fails
+GROUP_ANALYSIS_FAILED_TITLE = "Automatic Analysis Failed"
+
 
 class LLMAnalyzer:
     """Analyzes logs using Large Language Models"""
@@ -254,7 +257,7 @@ Only respond with valid JSON, no other text."""
         except Exception as e:
             logger.warning(f"LLM group analysis failed: {e}")
             return {
-                "issue_title": "Automatic Analysis Failed",
+                "issue_title": GROUP_ANALYSIS_FAILED_TITLE,
                 "category": "Network Connectivity",
                 "severity": entries[0].level,
                 "root_cause": "Unable to analyze with LLM",
@@ -0,0 +1,95 @@
+"""
+LLM Response Cache Module
+Persists LLM analysis results keyed by model, provider, instructions and log content
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+from models import LogEntry
+
+logger = logging.getLogger('log_analyzer.llm_cache')
+
+# Only this many entries contribute their fields to a group's fingerprint
+FINGERPRINT_MAX_MESSAGES = 20
+
+
+class LLMResponseCache:
+    """SQLite-backed cache of LLM issue-group analyses with a time-to-live"""
+
+    def __init__(self, db_path: str, ttl_seconds: int):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=5, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS llm_responses ('
+                'key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)'
+            )
+            self._conn.execute('DELETE FROM llm_responses WHERE expires_at <= ?', (time.time(),))
+        logger.info(f'LLM response cache opened: {db_path} (ttl={ttl_seconds}s)')
+
+    @staticmethod
+    def make_key(model_name: str, provider: str, entries: List[LogEntry],
+                 instruction_text: Optional[str] = None) -> str:
+        """Fingerprint an issue group for a given model, provider and instruction text
+
+        Covers what the analysis prompt is built from: each sampled entry's
+        source, event ID, level and message, plus the group's occurrence and
+        affected user/system counts. Entry timestamps are left out so a rerun
+        over the same logs reuses the result.
+        """
+        samples = sorted(
+            f"{entry.source or ''}\t{entry.event_id}\t{entry.level or ''}\t{entry.message or ''}"
+            for entry in entries[:FINGERPRINT_MAX_MESSAGES]
+        )
+        counts = (
+            f"{len(entries)}\t{len(set(entry.user_id for entry in entries))}"
+            f"\t{len(set(entry.system_name for entry in entries))}"
+        )
+        digest = hashlib.sha256()
+        for part in (model_name, provider, instruction_text or '', counts, '\n'.join(samples)):
+            digest.update(part.encode('utf-8', errors='replace'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cached analysis for key, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT response FROM llm_responses WHERE key = ? AND expires_at > ?',
+                (key, time.time())
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, response: Dict):
+        """Store an analysis result for key"""
+        payload = json.dumps(response)
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO llm_responses (key, response, expires_at) VALUES (?, ?, ?)',
+                (key, payload, time.time() + self.ttl_seconds)
+            )
+
+    def clear(self):
+        """Remove all cached analyses"""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM llm_responses')
+
+    def get_statistics(self) -> Dict:
+        """Return cumulative hit/miss counters"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
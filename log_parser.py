@@ -4,10 +4,18 @@ Log Parser Module - Parses various Windows Event Logs (both .log text files and
 import os
 import re
 import logging
+import multiprocessing
+import queue
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from logging.handlers import QueueHandler
+from typing import Collection, List, Dict, Tuple, Optional
 from models import LogEntry
-from config import NETWORK_ANALYSIS_ONLY, NETWORK_LOG_KEYWORDS
+from config import NETWORK_ANALYSIS_ONLY, NETWORK_LOG_KEYWORDS, PARSE_MAX_WORKERS, PARSE_CACHE_MAX_SESSIONS
 
 logger = logging.getLogger('log_analyzer.parser')
 
@@ -21,6 +29,85 @@ except ImportError:
     EvtxParser = None
     logger.info('EVTX support not available')
 
+# Below this many files, process start-up and pickling cost more than they save
+PARALLEL_PARSE_MIN_FILES = 8
+
+# Spawned rather than forked on every platform: spawn is all Windows offers, and
+# forking the multi-threaded API server can copy locks other threads hold
+_PARSE_POOL_CONTEXT = multiprocessing.get_context('spawn')
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+_worker_parser = None
+_worker_log_records = None  # worker processes only: records logged by the current task
+
+
+def _parse_pool_size() -> int:
+    return PARSE_MAX_WORKERS or os.cpu_count() or 1
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the shared parsing process pool, creating it on first use."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            max_workers = _parse_pool_size()
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=_PARSE_POOL_CONTEXT,
+                initializer=_init_parse_worker,
+                initargs=(logging.getLogger('log_analyzer').getEffectiveLevel(),)
+            )
+            logger.info(f'Started log parsing pool with {max_workers} worker processes')
+        return _parse_pool
+
+
+def _discard_parse_pool():
+    """Drop a broken parsing pool so the next call starts a fresh one."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            if sys.version_info >= (3, 9):
+                _parse_pool.shutdown(wait=False, cancel_futures=True)
+            else:
+                _parse_pool.shutdown(wait=False)
+            _parse_pool = None
+
+
+def _init_parse_worker(log_level: int):
+    """Pool initializer: collect the worker's log records instead of handling them.
+
+    Workers get no working handlers of their own: a spawned one has none, and
+    a forked one would inherit the parent's queue handler without the thread
+    that drains it. Each task hands its records back to the parent, which emits
+    them through its own handlers.
+    """
+    global _worker_log_records
+    _worker_log_records = queue.SimpleQueue()
+    package_logger = logging.getLogger('log_analyzer')
+    for handler in list(package_logger.handlers):
+        package_logger.removeHandler(handler)
+    package_logger.addHandler(QueueHandler(_worker_log_records))
+    package_logger.setLevel(log_level)
+    package_logger.propagate = False
+
+
+def _parse_file_task(task: Tuple[str, str, str, str]) -> Tuple[List[LogEntry], List[logging.LogRecord]]:
+    """Worker entry point: parse one file with a per-process LogParser.
+
+    Returns the file's entries and the log records emitted while parsing it.
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = LogParser()
+    entries = _worker_parser.parse_log_file(*task)
+    records = []
+    while True:
+        try:
+            records.append(_worker_log_records.get_nowait())
+        except queue.Empty:
+            return entries, records
+
 
 class LogParser:
     """Parses Windows Event Log files (both .log and .evtx formats)"""
@@ -52,6 +139,9 @@ class LogParser:
         # Initialize EVTX parser if available
         self.evtx_parser = EvtxParser() if EVTX_SUPPORT else None
         self.session_timestamp_pattern = re.compile(r"^\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}$")
+        # Session key -> per-file entry lists, least recently used first
+        self._session_cache = OrderedDict()
+        self._session_cache_lock = threading.Lock()
     
     def parse_log_file(self, file_path: str, user_id: str, system_name: str, session_timestamp: str) -> List[LogEntry]:
         """Parse a single log file and extract all events (supports both .log and .evtx formats)"""
@@ -171,7 +261,7 @@ class LogParser:
         # Default to current time if parsing fails
         return datetime.now()
 
-    def _is_supported_log_filename(self, filename: str, configured_log_types: Optional[List[str]] = None) -> bool:
+    def _is_supported_log_filename(self, filename: str, configured_log_types: Optional[Collection[str]] = None) -> bool:
         """Return True if a filename should be parsed as a log file."""
         lower_name = filename.lower()
 
@@ -204,20 +294,23 @@ class LogParser:
 
     def _find_log_files_in_directory(self, directory_path: str, configured_log_types: Optional[List[str]] = None) -> List[str]:
         """Return all parsable log filenames in a directory."""
+        # Hash lookups instead of list scans for the per-file log type check
+        if configured_log_types and not isinstance(configured_log_types, frozenset):
+            configured_log_types = frozenset(configured_log_types)
+
         try:
-            files = os.listdir(directory_path)
+            with os.scandir(directory_path) as entries:
+                log_files = [
+                    entry.name
+                    for entry in entries
+                    if entry.is_file()
+                    and self._is_supported_log_filename(entry.name, configured_log_types)
+                ]
         except Exception as e:
             logger.error(f"Could not list directory {directory_path}: {e}")
             return []
 
-        log_files = [
-            file_name
-            for file_name in files
-            if os.path.isfile(os.path.join(directory_path, file_name))
-            and self._is_supported_log_filename(file_name, configured_log_types)
-        ]
-
-        return sorted(set(log_files))
+        return sorted(log_files)
 
     def _extract_session_metadata(self, relative_parts: List[str]) -> Tuple[str, str, str]:
         """Infer user/system/session metadata from a relative path."""
@@ -287,18 +380,26 @@ class LogParser:
         return discovered
     
     def parse_all_logs(self, base_logs_dir: str, log_types: List[str]) -> List[LogEntry]:
-        """Parse all logs from the directory structure (both .log text files and .evtx binary files)"""
+        """Parse all logs from the directory structure (both .log text files and .evtx binary files)
+
+        Files are parsed in a process pool when there are at least
+        PARALLEL_PARSE_MIN_FILES of them; results keep discovery order.
+        Sessions whose files are unchanged since the last call reuse the
+        cached entries (up to PARSE_CACHE_MAX_SESSIONS sessions).
+        """
         all_entries = []
         
         discovered_logs = self.discover_logs(base_logs_dir)
         logger.info(f"Discovered {len(discovered_logs)} log sessions")
         print(f"Discovered {len(discovered_logs)} log sessions")
         
+        # (file_path, user_id, system_name, session_timestamp) per file still to be parsed
+        parse_tasks = []
+        # (cache key, session_timestamp, file paths, cached entry lists or None) per session
+        sessions = []
         for user_id, system_name, session_timestamp, session_path in discovered_logs:
             logger.debug(f"Processing session: User={user_id}, System={system_name}, Session={session_timestamp}")
             logger.debug(f"Session path: {session_path}")
-            logger.debug(f"Session path exists: {os.path.exists(session_path)}")
-            logger.debug(f"Session path is dir: {os.path.isdir(session_path)}")
             
             print(f"Parsing logs for User: {user_id}, System: {system_name}, Session: {session_timestamp}")
             
@@ -308,9 +409,22 @@ class LogParser:
                 continue
 
             logger.debug(f"Found {len(session_log_files)} supported log files in session directory: {session_log_files}")
-            for filename in session_log_files:
-                log_file_path = os.path.join(session_path, filename)
-                entries = self.parse_log_file(log_file_path, user_id, system_name, session_timestamp)
+            file_paths = [os.path.join(session_path, filename) for filename in session_log_files]
+            cache_key = self._session_cache_key(user_id, system_name, session_timestamp, file_paths)
+            cached = self._get_cached_session(cache_key)
+            if cached is None:
+                parse_tasks.extend((file_path, user_id, system_name, session_timestamp) for file_path in file_paths)
+            else:
+                logger.debug(f"Reusing cached parse results for session {session_path}")
+            sessions.append((cache_key, session_timestamp, file_paths, cached))
+        
+        parsed = iter(self._parse_files(parse_tasks))
+        for cache_key, session_timestamp, file_paths, cached in sessions:
+            if cached is None:
+                cached = [next(parsed) for _ in file_paths]
+                self._store_cached_session(cache_key, cached)
+            for log_file_path, entries in zip(file_paths, cached):
+                filename = os.path.basename(log_file_path)
                 all_entries.extend(entries)
                 print(f"  - Parsed {len(entries)} entries from {filename}")
                 logger.info(f"Parsed {len(entries)} entries from {filename} in session {session_timestamp}")
@@ -318,3 +432,50 @@ class LogParser:
         logger.info(f"Total log parsing complete: {len(all_entries)} entries parsed from all sources")
         print(f"\nTotal entries parsed: {len(all_entries)}")
         return all_entries
+
+    def _session_cache_key(self, user_id: str, system_name: str, session_timestamp: str, file_paths: List[str]) -> Optional[tuple]:
+        """Key a session by its identity and each file's mtime and size; None if a file can't be stat'd."""
+        try:
+            file_stats = tuple(
+                (file_path, stat.st_mtime_ns, stat.st_size)
+                for file_path, stat in ((file_path, os.stat(file_path)) for file_path in file_paths)
+            )
+        except OSError:
+            return None
+        return (user_id, system_name, session_timestamp, file_stats)
+
+    def _get_cached_session(self, cache_key: Optional[tuple]) -> Optional[List[List[LogEntry]]]:
+        if cache_key is None or PARSE_CACHE_MAX_SESSIONS <= 0:
+            return None
+        with self._session_cache_lock:
+            cached = self._session_cache.get(cache_key)
+            if cached is not None:
+                self._session_cache.move_to_end(cache_key)
+            return cached
+
+    def _store_cached_session(self, cache_key: Optional[tuple], file_entries: List[List[LogEntry]]):
+        if cache_key is None or PARSE_CACHE_MAX_SESSIONS <= 0:
+            return
+        with self._session_cache_lock:
+            self._session_cache[cache_key] = file_entries
+            self._session_cache.move_to_end(cache_key)
+            while len(self._session_cache) > PARSE_CACHE_MAX_SESSIONS:
+                self._session_cache.popitem(last=False)
+
+    def _parse_files(self, parse_tasks: List[Tuple[str, str, str, str]]) -> List[List[LogEntry]]:
+        """Parse each task's file, returning entry lists in task order."""
+        if len(parse_tasks) < PARALLEL_PARSE_MIN_FILES or _parse_pool_size() < 2:
+            return [self.parse_log_file(*task) for task in parse_tasks]
+
+        chunksize = max(1, len(parse_tasks) // (4 * _parse_pool_size()))
+        try:
+            results = []
+            for entries, records in _get_parse_pool().map(_parse_file_task, parse_tasks, chunksize=chunksize):
+                for record in records:
+                    logging.getLogger(record.name).handle(record)
+                results.append(entries)
+            return results
+        except BrokenProcessPool as e:
+            logger.error(f"Log parsing pool failed ({e}); parsing serially")
+            _discard_parse_pool()
+            return [self.parse_log_file(*task) for task in parse_tasks]
@@ -1,14 +1,28 @@
 """
 Data models for log analysis
 """
+import sys
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from datetime import datetime
 
 
+def _intern(value):
+    """Intern low-cardinality labels so repeated values share one string"""
+    return sys.intern(value) if type(value) is str else value
+
+
 @dataclass
 class LogEntry:
-    """Represents a single log entry"""
+    """Represents a single log entry
+
+    Slotted: parses can hold millions of entries, and each one saves the
+    memory of a per-instance __dict__. Declared by hand because
+    dataclass(slots=True) needs Python 3.10.
+    """
+    __slots__ = ('event_number', 'level', 'source', 'event_id', 'timestamp', 'message',
+                 'log_type', 'user_id', 'system_name', 'session_timestamp')
+
     event_number: int
     level: str
     source: str
@@ -19,6 +33,16 @@ class LogEntry:
     user_id: str
     system_name: str
     session_timestamp: str
+    
+    def __post_init__(self):
+        # Levels, sources and identities repeat across millions of entries;
+        # interning keeps one copy of each and makes equality/hash lookups cheap
+        self.level = _intern(self.level)
+        self.source = _intern(self.source)
+        self.log_type = _intern(self.log_type)
+        self.user_id = _intern(self.user_id)
+        self.system_name = _intern(self.system_name)
+        self.session_timestamp = _intern(self.session_timestamp)
 
 
 @dataclass
@@ -36,6 +60,10 @@ class Issue:
     root_cause: str = ""
     solution: str = ""
     
+    def __post_init__(self):
+        self.category = _intern(self.category)
+        self.severity = _intern(self.severity)
+    
     @property
     def user_count(self) -> int:
         """Get unique user count"""
@@ -109,6 +109,10 @@ class ReportGenerator:
         
         print(f"\n✓ HTML Report saved: {filepath}")
     
+    def render_html_report(self, report: AnalysisReport) -> str:
+        """Return the HTML report content without writing it to disk"""
+        return self._generate_html_content(report)
+    
     def _generate_html_content(self, report: AnalysisReport) -> str:
         """Generate HTML content for report"""
         sorted_issues = report.get_sorted_issues()
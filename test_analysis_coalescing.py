@@ -0,0 +1,114 @@
+"""
+Tests for sharing one in-flight analysis between identical concurrent requests
+Run with: python -m unittest test_analysis_coalescing
+"""
+
+import threading
+import unittest
+from unittest import mock
+
+import api_server
+
+
+WAIT_SECONDS = 5
+
+
+class AnalysisCoalescingTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.dict(api_server._inflight_runs, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.run_calls = []
+        self.run_started = threading.Event()
+        self.release_run = threading.Event()
+
+    def _patch_run_analysis(self, outcome):
+        """Replace _run_analysis with one that blocks until released, then returns or raises outcome"""
+        def run_analysis(use_llm, model_name, provider, source, force):
+            self.run_calls.append(source)
+            self.run_started.set()
+            self.release_run.wait(WAIT_SECONDS)
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return outcome
+
+        patcher = mock.patch.object(api_server, '_run_analysis', side_effect=run_analysis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run_concurrently(self, sources):
+        """Call _execute_analysis once per source, the first as the owner; return {source: result or exception}"""
+        outcomes = {}
+
+        def call(source):
+            try:
+                outcomes[source] = api_server._execute_analysis(False, 'llama3.2:3b', 'ollama', source=source)
+            except Exception as e:
+                outcomes[source] = e
+
+        owner = threading.Thread(target=call, args=(sources[0],))
+        owner.start()
+        self.assertTrue(self.run_started.wait(WAIT_SECONDS))
+
+        # Count joiners as they block on the owner's Future, then let the run finish
+        future, = api_server._inflight_runs.values()
+        joined = threading.Semaphore(0)
+        wait_for_result = future.result
+
+        def result(timeout=None):
+            joined.release()
+            return wait_for_result(timeout)
+
+        future.result = result
+        joiners = [threading.Thread(target=call, args=(source,)) for source in sources[1:]]
+        for joiner in joiners:
+            joiner.start()
+        for _ in joiners:
+            self.assertTrue(joined.acquire(timeout=WAIT_SECONDS))
+
+        self.release_run.set()
+        for thread in [owner] + joiners:
+            thread.join(WAIT_SECONDS)
+            self.assertFalse(thread.is_alive())
+        return outcomes
+
+    def test_identical_concurrent_requests_share_one_run(self):
+        self._patch_run_analysis({'success': True, 'issues': [{'issueId': 'NET-001'}], 'analysis': {'source': 'manual'}})
+
+        outcomes = self._run_concurrently(['manual', 'dashboard', 'api'])
+
+        self.assertEqual(self.run_calls, ['manual'])
+        for source, outcome in outcomes.items():
+            self.assertEqual(outcome['issues'], [{'issueId': 'NET-001'}])
+            self.assertEqual(outcome['analysis']['source'], source)
+        self.assertEqual(api_server._inflight_runs, {})
+
+    def test_failure_propagates_to_every_waiter(self):
+        error = RuntimeError('No log entries found')
+        self._patch_run_analysis(error)
+
+        outcomes = self._run_concurrently(['manual', 'dashboard', 'api'])
+
+        self.assertEqual(self.run_calls, ['manual'])
+        self.assertEqual(set(outcomes), {'manual', 'dashboard', 'api'})
+        for outcome in outcomes.values():
+            self.assertIs(outcome, error)
+        self.assertEqual(api_server._inflight_runs, {})
+
+    def test_watcher_skips_while_a_run_is_in_flight(self):
+        self._patch_run_analysis({'success': True, 'issues': [], 'analysis': {'source': 'manual'}})
+        owner = threading.Thread(target=api_server._execute_analysis, args=(False, 'llama3.2:3b', 'ollama'))
+        owner.start()
+        self.assertTrue(self.run_started.wait(WAIT_SECONDS))
+
+        try:
+            self.assertIsNone(api_server._execute_analysis(False, 'llama3.2:3b', 'ollama', source='watcher'))
+        finally:
+            self.release_run.set()
+            owner.join(WAIT_SECONDS)
+        self.assertEqual(self.run_calls, ['manual'])
+
+
+if __name__ == '__main__':
+    unittest.main()
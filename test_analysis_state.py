@@ -0,0 +1,169 @@
+"""
+Tests for persisting and restoring the latest analysis across restarts
+Run with: python -m unittest test_analysis_state
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import api_server
+
+
+PARAMS = (False, None, None, False, 'instructions-hash')
+SIGNATURE = (1700000000000000000, 3)
+
+
+def _result(issue_count):
+    return {
+        'success': True,
+        'analysis': {'generated_at': '2026-01-01T00:00:00', 'issues_found': issue_count, 'source': 'manual'},
+        'issues': [{'issueId': f'ISSUE-{n}', 'solution': 'Restart the service'} for n in range(issue_count)],
+        'statistics': {}
+    }
+
+
+class AnalysisStateTest(unittest.TestCase):
+    """Round-trips api_server's persisted state through a temporary logs directory"""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.state_path = os.path.join(tmp_dir.name, '.watcher_state.json')
+        self.report_path = os.path.join(tmp_dir.name, '.latest_report.json')
+
+        patchers = [
+            mock.patch.object(api_server, 'WATCHER_STATE_PATH', self.state_path),
+            mock.patch.object(api_server, 'LATEST_REPORT_PATH', self.report_path),
+            mock.patch.object(api_server, '_persisted_state_key', None),
+            mock.patch.object(api_server, 'analysis_results', {}),
+            mock.patch.dict(api_server.analysis_cache, clear=True),
+            mock.patch.dict(api_server.analysis_state),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self._forget_in_memory_state()
+
+    def _forget_in_memory_state(self):
+        """Put the module back in the state of a freshly started process"""
+        api_server.analysis_cache.clear()
+        api_server.analysis_results.clear()
+        api_server.analysis_state.update(
+            last_run_at=None, last_source=None, last_error=None,
+            last_logs_signature=None, last_params=None
+        )
+        api_server._persisted_state_key = None
+
+    def _publish(self, result, signature=SIGNATURE, params=PARAMS):
+        api_server._publish_latest_result(result)
+        api_server._record_successful_run('manual', signature, params)
+
+    def _count_writes(self):
+        write = mock.Mock(wraps=api_server._atomic_write_bytes)
+        patcher = mock.patch.object(api_server, '_atomic_write_bytes', write)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return write
+
+    def test_publish_persists_report_and_state(self):
+        self._publish(_result(2))
+
+        self.assertTrue(os.path.exists(self.report_path))
+        state = api_server._read_json_file(self.state_path)
+        self.assertEqual(state['etag'], api_server.analysis_cache['latest_etag'])
+        self.assertEqual(tuple(state['logs_signature']), SIGNATURE)
+
+    def test_unchanged_republish_does_not_rewrite(self):
+        result = _result(2)
+        self._publish(result)
+        write = self._count_writes()
+
+        self._publish(result)
+
+        write.assert_not_called()
+
+    def test_new_logs_signature_rewrites_state_only(self):
+        result = _result(2)
+        self._publish(result)
+        write = self._count_writes()
+
+        self._publish(result, signature=(SIGNATURE[0] + 1, SIGNATURE[1]))
+
+        self.assertEqual([call.args[0] for call in write.call_args_list], [self.state_path])
+
+    def test_new_result_rewrites_report_and_state(self):
+        self._publish(_result(2))
+        write = self._count_writes()
+
+        self._publish(_result(3))
+
+        self.assertEqual(sorted(call.args[0] for call in write.call_args_list),
+                         sorted([self.report_path, self.state_path]))
+
+    def test_restore_reloads_persisted_result(self):
+        result = _result(2)
+        self._publish(result)
+        etag = api_server.analysis_cache['latest_etag']
+        self._forget_in_memory_state()
+
+        api_server._restore_persisted_analysis()
+
+        self.assertEqual(api_server.analysis_cache['latest'], result)
+        self.assertEqual(api_server.analysis_cache['latest_etag'], etag)
+        self.assertEqual(api_server.analysis_state['last_logs_signature'], SIGNATURE)
+        self.assertEqual(api_server.analysis_state['last_params'], PARAMS)
+        self.assertEqual(api_server.analysis_results[(PARAMS, SIGNATURE)], result)
+
+    def test_restored_state_is_not_rewritten_by_cache_hit(self):
+        self._publish(_result(2))
+        self._forget_in_memory_state()
+        api_server._restore_persisted_analysis()
+        write = self._count_writes()
+
+        self._publish(api_server.analysis_cache['latest'])
+
+        write.assert_not_called()
+
+    def test_restore_without_state_file_leaves_memory_empty(self):
+        api_server._restore_persisted_analysis()
+
+        self.assertNotIn('latest', api_server.analysis_cache)
+        self.assertIsNone(api_server.analysis_state['last_logs_signature'])
+
+    def test_restore_ignores_corrupt_state_file(self):
+        self._publish(_result(2))
+        self._forget_in_memory_state()
+        with open(self.state_path, 'wb') as f:
+            f.write(b'{"etag": ')
+
+        api_server._restore_persisted_analysis()
+
+        self.assertNotIn('latest', api_server.analysis_cache)
+        self.assertIsNone(api_server.analysis_state['last_logs_signature'])
+
+    def test_restore_ignores_report_that_does_not_match_state(self):
+        self._publish(_result(2))
+        self._forget_in_memory_state()
+        with open(self.report_path, 'wb') as f:
+            f.write(api_server._dumps_json(_result(5)))
+
+        api_server._restore_persisted_analysis()
+
+        self.assertNotIn('latest', api_server.analysis_cache)
+        self.assertIsNone(api_server.analysis_state['last_logs_signature'])
+
+    def test_restore_ignores_missing_report(self):
+        self._publish(_result(2))
+        self._forget_in_memory_state()
+        os.remove(self.report_path)
+
+        api_server._restore_persisted_analysis()
+
+        self.assertNotIn('latest', api_server.analysis_cache)
+        self.assertIsNone(api_server.analysis_state['last_logs_signature'])
+
+
+if __name__ == '__main__':
+    unittest.main()
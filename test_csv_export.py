@@ -0,0 +1,189 @@
+"""
+Tests for the streamed (and gzip-encoded) CSV report export
+Run with: python -m unittest test_csv_export
+"""
+
+import csv
+import gzip
+import io
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import api_server
+
+
+REPORT = {
+    'success': True,
+    'analysis': {'generated_at': '2026-01-01T09:00:00', 'issues_found': 3, 'source': 'manual'},
+    'issues': [
+        {
+            'issueId': 'NET-001', 'category': 'Network Connectivity', 'severity': 'CRITICAL',
+            'description': 'DNS resolution failed for "corp.example.com", retrying', 'pattern': 'DNS',
+            'userCount': 2, 'affectedUsers': ['user1', 'user2'], 'affectedSystems': ['soc-PC1', 'soc-PC2'],
+            'occurrences': 14, 'rootCause': 'DNS server unreachable',
+            'solution': ['Check the DNS server', 'Flush the resolver cache'], 'samples': []
+        },
+        {
+            'issueId': 'SEC-002', 'category': 'Security', 'severity': 'ERROR',
+            'description': 'Logon failure\nfor service account', 'pattern': '4625',
+            'userCount': 1, 'affectedUsers': ['user3'], 'affectedSystems': ['soc-PC3'],
+            'occurrences': 1, 'rootCause': 'Expired password', 'solution': 'Rotate the password', 'samples': []
+        },
+        {
+            'issueId': 'WLAN-003', 'category': 'Network Connectivity', 'severity': 'WARNING',
+            'description': 'WLAN disconnects, reason 7', 'pattern': 'WLAN',
+            'userCount': 1, 'affectedUsers': ['user1'], 'affectedSystems': ['soc-PC1'],
+            'occurrences': 3, 'rootCause': 'Roaming between access points', 'solution': 'Update the WLAN driver', 'samples': []
+        },
+    ],
+    'statistics': {}
+}
+
+# Output of the buffered (csv.writer over io.StringIO) export for REPORT, before
+# exports were streamed
+BUFFERED_EXPORTS = {
+    'General Report': (
+        'Issue ID,Severity,Category,Description,Occurrences,Root Cause,Solution,Affected Systems,Affected Users\r\n'
+        'NET-001,CRITICAL,Network Connectivity,"DNS resolution failed for ""corp.example.com"", retrying",14,'
+        'DNS server unreachable,Check the DNS server | Flush the resolver cache,"soc-PC1, soc-PC2","user1, user2"\r\n'
+        'SEC-002,ERROR,Security,"Logon failure\n'
+        'for service account",1,Expired password,Rotate the password,soc-PC3,user3\r\n'
+        'WLAN-003,WARNING,Network Connectivity,"WLAN disconnects, reason 7",3,Roaming between access points,'
+        'Update the WLAN driver,soc-PC1,user1\r\n'
+    ),
+    'Executive Summary': (
+        'Report Type,Generated At,Total Issues,Critical,Error,Warning,Systems,Users\r\n'
+        'Executive Summary,2026-01-02T03:04:05,3,1,1,1,3,3\r\n'
+        '\r\n'
+        'Key Findings\r\n'
+        '1 critical security/stability issues require immediate attention\r\n'
+        '3 systems impacted across the fleet\r\n'
+        '"Top issue: DNS resolution failed for ""corp.example.com"", retrying"\r\n'
+        'Risk Index: 45\r\n'
+        '\r\n'
+        'Top Issues,Severity,Occurrences,Description\r\n'
+        ',CRITICAL,14,"DNS resolution failed for ""corp.example.com"", retrying"\r\n'
+        ',WARNING,3,"WLAN disconnects, reason 7"\r\n'
+        ',ERROR,1,"Logon failure\n'
+        'for service account"\r\n'
+    ),
+    'Incident Analysis': (
+        'Incident ID,Severity,Category,Description,Occurrences,Systems,Users,Root Cause\r\n'
+        'NET-001,CRITICAL,Network Connectivity,"DNS resolution failed for ""corp.example.com"", retrying",14,'
+        '"soc-PC1, soc-PC2","user1, user2",DNS server unreachable\r\n'
+        'WLAN-003,WARNING,Network Connectivity,"WLAN disconnects, reason 7",3,soc-PC1,user1,'
+        'Roaming between access points\r\n'
+        'SEC-002,ERROR,Security,"Logon failure\n'
+        'for service account",1,soc-PC3,user3,Expired password\r\n'
+    ),
+}
+
+REPORT_TYPES = [
+    'Executive Summary', 'Board Report', 'Business Impact Analysis', 'Fleet Health Dashboard',
+    'Incident Analysis', 'Asset Inventory', 'Compliance Status Report', 'Security Incident Log',
+    'Trend Analysis Report', 'Recurring Issues Analysis', 'Comparative Analysis', 'Capacity Planning',
+    'General Report', 'Remediation Status'
+]
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 1, 2, 3, 4, 5)
+
+
+def _rows(text):
+    return list(csv.reader(io.StringIO(text, newline='')))
+
+
+def _buffered_csv(report_type):
+    """Build the export the pre-streaming way: every row written into one buffer"""
+    filtered_data = api_server.generate_report_data(REPORT, report_type)
+    output = io.StringIO()
+    csv.writer(output).writerows(api_server._iter_csv_rows(filtered_data, report_type))
+    return output.getvalue()
+
+
+class CsvExportTest(unittest.TestCase):
+
+    def setUp(self):
+        patchers = [
+            # Requests would otherwise start the background log watcher
+            mock.patch.object(api_server, 'watcher_started', True),
+            mock.patch.object(api_server, 'datetime', _FixedDatetime),
+            mock.patch.dict(api_server.analysis_cache, clear=True),
+            mock.patch.dict(api_server._report_data_cache, clear=True),
+            mock.patch.dict(api_server._csv_export_cache, clear=True),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        api_server._publish_latest_result(REPORT)
+        self.client = api_server.app.test_client()
+
+    def _export(self, report_type, accept_encoding='identity'):
+        response = self.client.get(
+            '/api/reports/export',
+            query_string={'format': 'csv', 'reportType': report_type},
+            headers={'Accept-Encoding': accept_encoding}
+        )
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_streamed_export_matches_buffered_output(self):
+        for report_type, expected in BUFFERED_EXPORTS.items():
+            with self.subTest(report_type=report_type):
+                response = self._export(report_type)
+
+                self.assertEqual(response.mimetype, 'text/csv')
+                self.assertNotIn('Content-Encoding', response.headers)
+                self.assertEqual(response.get_data(as_text=True), expected)
+
+    def test_gzip_stream_decodes_to_the_identity_export(self):
+        for report_type in REPORT_TYPES:
+            with self.subTest(report_type=report_type):
+                plain = self._export(report_type).get_data()
+                response = self._export(report_type, accept_encoding='gzip')
+
+                self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+                self.assertIn('Accept-Encoding', response.vary)
+                decoded = gzip.decompress(response.get_data())
+                self.assertEqual(decoded, plain)
+                self.assertEqual(_rows(decoded.decode('utf-8')), _rows(_buffered_csv(report_type)))
+
+    def test_rows_and_headers_match_buffered_writer_for_every_report_type(self):
+        for report_type in REPORT_TYPES:
+            with self.subTest(report_type=report_type):
+                streamed = self._export(report_type).get_data(as_text=True)
+                expected = _buffered_csv(report_type)
+
+                self.assertEqual(_rows(streamed)[0], _rows(expected)[0])
+                self.assertEqual(_rows(streamed), _rows(expected))
+                self.assertEqual(streamed, expected)
+
+    def test_output_is_unchanged_across_chunk_boundaries(self):
+        with mock.patch.object(api_server, 'CSV_STREAM_CHUNK_SIZE', 16):
+            for report_type, expected in BUFFERED_EXPORTS.items():
+                with self.subTest(report_type=report_type):
+                    chunks = list(api_server._stream_csv(
+                        api_server._iter_csv_rows(api_server.generate_report_data(REPORT, report_type), report_type)
+                    ))
+                    self.assertGreater(len(chunks), 1)
+                    self.assertEqual(''.join(chunks), expected)
+
+                    response = self._export(report_type, accept_encoding='gzip')
+                    self.assertEqual(gzip.decompress(response.get_data()).decode('utf-8'), expected)
+
+    def test_replayed_export_matches_first_export(self):
+        first = gzip.decompress(self._export('General Report', accept_encoding='gzip').get_data())
+        self.assertTrue(api_server._csv_export_cache)
+        second = self._export('General Report', accept_encoding='gzip')
+
+        self.assertEqual(gzip.decompress(second.get_data()), first)
+        self.assertEqual(second.headers['Content-Disposition'],
+                         'attachment; filename="general_report_20260102_030405.csv"')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Tests for ETag / If-None-Match revalidation of the report, export and config endpoints
+Run with: python -m unittest test_etag_revalidation
+"""
+
+import json
+import unittest
+from unittest import mock
+
+import api_server
+
+
+def _report(issue_ids):
+    return {
+        'success': True,
+        'analysis': {'generated_at': '2026-01-01T09:00:00', 'issues_found': len(issue_ids), 'source': 'manual'},
+        'issues': [
+            {'issueId': issue_id, 'category': 'Network Connectivity', 'severity': 'ERROR',
+             'description': f'{issue_id} failed', 'occurrences': 2, 'affectedSystems': ['soc-PC1'],
+             'affectedUsers': ['user1'], 'rootCause': 'Unknown', 'solution': 'Retry'}
+            for issue_id in issue_ids
+        ],
+        'statistics': {}
+    }
+
+
+class EtagRevalidationTest(unittest.TestCase):
+
+    def setUp(self):
+        patchers = [
+            # Requests would otherwise start the background log watcher
+            mock.patch.object(api_server, 'watcher_started', True),
+            mock.patch.object(api_server, '_config_response_cache', None),
+            mock.patch.dict(api_server.analysis_cache, clear=True),
+            mock.patch.dict(api_server._report_data_cache, clear=True),
+            mock.patch.dict(api_server._csv_export_cache, clear=True),
+            mock.patch.dict(api_server.instruction_state),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.report = _report(['NET-001', 'NET-002'])
+        api_server._publish_latest_result(self.report)
+        self.client = api_server.app.test_client()
+
+    def _get(self, url, etag=None, **kwargs):
+        headers = kwargs.pop('headers', {})
+        if etag is not None:
+            headers['If-None-Match'] = etag
+        return self.client.get(url, headers=headers, **kwargs)
+
+    def _assert_not_modified(self, response, etag):
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.get_data(), b'')
+        self.assertEqual(response.headers['ETag'], etag)
+
+    def test_latest_report_returns_etag(self):
+        response = self._get('/api/reports/latest')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.get_data()), self.report)
+        self.assertEqual(response.headers['ETag'], f'"{api_server.analysis_cache["latest_etag"]}"')
+
+    def test_latest_report_revalidates_with_304(self):
+        etag = self._get('/api/reports/latest').headers['ETag']
+
+        self._assert_not_modified(self._get('/api/reports/latest', etag=etag), etag)
+
+    def test_latest_report_etag_changes_after_new_analysis(self):
+        old_etag = self._get('/api/reports/latest').headers['ETag']
+
+        api_server._publish_latest_result(_report(['NET-001', 'NET-003']))
+        response = self._get('/api/reports/latest', etag=old_etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], old_etag)
+        self.assertEqual(json.loads(response.get_data())['issues'][1]['issueId'], 'NET-003')
+
+    def test_exports_revalidate_with_304(self):
+        for format_type in ('csv', 'json'):
+            with self.subTest(format=format_type):
+                query = {'format': format_type, 'reportType': 'Incident Analysis'}
+                first = self._get('/api/reports/export', query_string=query)
+                self.assertEqual(first.status_code, 200)
+                etag = first.headers['ETag']
+
+                self._assert_not_modified(self._get('/api/reports/export', etag=etag, query_string=query), etag)
+
+    def test_export_etag_depends_on_report_type_and_encoding(self):
+        def export_etag(report_type, accept_encoding='identity'):
+            return self._get('/api/reports/export', headers={'Accept-Encoding': accept_encoding},
+                             query_string={'format': 'csv', 'reportType': report_type}).headers['ETag']
+
+        self.assertNotEqual(export_etag('Incident Analysis'), export_etag('General Report'))
+        self.assertNotEqual(export_etag('Incident Analysis'), export_etag('Incident Analysis', 'gzip'))
+
+    def test_export_etag_changes_after_new_analysis(self):
+        query = {'format': 'csv', 'reportType': 'General Report'}
+        old_etag = self._get('/api/reports/export', query_string=query).headers['ETag']
+
+        api_server._publish_latest_result(_report(['NET-004']))
+        response = self._get('/api/reports/export', etag=old_etag, query_string=query)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], old_etag)
+        self.assertIn('NET-004', response.get_data(as_text=True))
+
+    def test_config_revalidates_with_304(self):
+        first = self._get('/api/config')
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers['ETag']
+
+        self._assert_not_modified(self._get('/api/config', etag=etag), etag)
+
+    def test_config_etag_changes_with_instruction_state(self):
+        old_etag = self._get('/api/config').headers['ETag']
+
+        api_server.instruction_state['enabled'] = not api_server.instruction_state.get('enabled', False)
+        response = self._get('/api/config', etag=old_etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], old_etag)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Tests for the persistent LLM response cache
+Run with: python -m unittest test_llm_cache
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+import api_server
+from llm_analyzer import GROUP_ANALYSIS_FAILED_TITLE
+from llm_cache import LLMResponseCache
+from models import LogEntry
+
+
+def _entry(event_number=1, level='Error', source='Tcpip', event_id=4227,
+           message='TCP/IP failed to establish an outgoing connection',
+           timestamp=datetime(2026, 1, 1, 12, 0, 0), user_id='user1', system_name='PC-1'):
+    return LogEntry(event_number, level, source, event_id, timestamp, message,
+                    'System', user_id, system_name, '2026-01-01_12-00-00')
+
+
+def _key(entries, model='llama3.2:3b', provider='ollama', instructions=None):
+    return LLMResponseCache.make_key(model, provider, entries, instructions)
+
+
+class MakeKeyTest(unittest.TestCase):
+
+    def test_same_group_at_different_times_shares_a_key(self):
+        earlier = [_entry(n, timestamp=datetime(2026, 1, 1) + timedelta(minutes=n)) for n in range(3)]
+        later = [_entry(n, timestamp=datetime(2026, 2, 1) + timedelta(minutes=n)) for n in range(3)]
+
+        self.assertEqual(_key(earlier), _key(later))
+
+    def test_key_ignores_entry_order(self):
+        entries = [_entry(1, source='Tcpip'), _entry(2, source='Dnscache')]
+
+        self.assertEqual(_key(entries), _key(list(reversed(entries))))
+
+    def test_same_message_from_another_source_event_or_level_gets_its_own_key(self):
+        base = _key([_entry()])
+
+        self.assertNotEqual(base, _key([_entry(source='Dnscache')]))
+        self.assertNotEqual(base, _key([_entry(event_id=4226)]))
+        self.assertNotEqual(base, _key([_entry(level='Warning')]))
+
+    def test_occurrence_and_affected_counts_change_the_key(self):
+        base = _key([_entry(1), _entry(2)])
+
+        self.assertNotEqual(base, _key([_entry(1), _entry(2), _entry(3)]))
+        self.assertNotEqual(base, _key([_entry(1), _entry(2, user_id='user2')]))
+        self.assertNotEqual(base, _key([_entry(1), _entry(2, system_name='PC-2')]))
+
+    def test_model_provider_and_instructions_change_the_key(self):
+        entries = [_entry()]
+        base = _key(entries)
+
+        self.assertNotEqual(base, _key(entries, model='mistral:7b'))
+        self.assertNotEqual(base, _key(entries, provider='openai'))
+        self.assertNotEqual(base, _key(entries, instructions='Focus on VPN issues'))
+
+    def test_fields_do_not_run_together(self):
+        self.assertNotEqual(_key([_entry()], model='ab', provider='c'),
+                            _key([_entry()], model='a', provider='bc'))
+
+
+class LLMResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.cache = LLMResponseCache(os.path.join(tmp_dir.name, 'llm_cache.sqlite3'), ttl_seconds=60)
+        self.addCleanup(self.cache._conn.close)
+
+    def test_get_returns_stored_response(self):
+        self.cache.set('key', {'issue_title': 'DNS failures'})
+
+        self.assertEqual(self.cache.get('key'), {'issue_title': 'DNS failures'})
+        self.assertIsNone(self.cache.get('other'))
+        self.assertEqual(self.cache.get_statistics(), {'hits': 1, 'misses': 1})
+
+    def test_entries_expire_after_ttl(self):
+        with mock.patch('llm_cache.time.time', return_value=1000.0):
+            self.cache.set('key', {'issue_title': 'DNS failures'})
+        with mock.patch('llm_cache.time.time', return_value=1059.0):
+            self.assertIsNotNone(self.cache.get('key'))
+        with mock.patch('llm_cache.time.time', return_value=1060.0):
+            self.assertIsNone(self.cache.get('key'))
+
+    def test_clear_removes_everything(self):
+        self.cache.set('key', {'issue_title': 'DNS failures'})
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get('key'))
+
+
+class _FakeAnalyzer:
+    """Counts provider calls in place of LLMAnalyzer"""
+
+    model_name = 'llama3.2:3b'
+    provider = 'ollama'
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def analyze_issue_group_with_llm(self, entries, instruction_text=None):
+        self.calls += 1
+        return dict(self.result)
+
+
+class CachedLLMAnalyzeTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        cache = LLMResponseCache(os.path.join(tmp_dir.name, 'llm_cache.sqlite3'), ttl_seconds=60)
+        self.addCleanup(cache._conn.close)
+        patcher = mock.patch.object(api_server, 'llm_response_cache', cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cache_hit_bypasses_the_analyzer(self):
+        analyzer = _FakeAnalyzer({'issue_title': 'DNS failures'})
+        entries = [_entry(1), _entry(2)]
+
+        first = api_server._cached_llm_analyze(analyzer, entries)
+        second = api_server._cached_llm_analyze(analyzer, entries)
+
+        self.assertEqual(analyzer.calls, 1)
+        self.assertEqual(first, second)
+
+    def test_different_group_misses(self):
+        analyzer = _FakeAnalyzer({'issue_title': 'DNS failures'})
+
+        api_server._cached_llm_analyze(analyzer, [_entry(source='Tcpip')])
+        api_server._cached_llm_analyze(analyzer, [_entry(source='Dnscache')])
+
+        self.assertEqual(analyzer.calls, 2)
+
+    def test_failed_analysis_is_not_cached(self):
+        analyzer = _FakeAnalyzer({'issue_title': GROUP_ANALYSIS_FAILED_TITLE})
+        entries = [_entry()]
+
+        api_server._cached_llm_analyze(analyzer, entries)
+        api_server._cached_llm_analyze(analyzer, entries)
+
+        self.assertEqual(analyzer.calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
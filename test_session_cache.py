@@ -0,0 +1,132 @@
+"""
+Tests for LogParser's per-session parse cache
+Run with: python -m unittest test_session_cache
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import log_parser
+from config import LOG_TYPES
+from log_parser import LogParser
+
+
+EVENT_TEMPLATE = """Event #{number}
+--------------------------------------------------------------------------------
+Time:       /Date(17720964{number:05d}
+Level:      Warning
+Source:     Microsoft-Windows-NCSI
+Event ID:   4042
+Category:   Network
+
+Message:
+Capability change on adapter {number}
+
+================================================================================
+
+"""
+
+
+def _write_log(path, event_count):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("DETAILED EVENT LOG\n" + "=" * 80 + "\n\n")
+        for number in range(1, event_count + 1):
+            f.write(EVENT_TEMPLATE.format(number=number))
+
+
+class SessionCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.logs_dir = tmp_dir.name
+        self.parser = LogParser()
+
+    def _session_file(self, user_id, filename='network_logs.txt'):
+        return os.path.join(self.logs_dir, user_id, 'soc-PC1', '2026-01-01_10-00-00', filename)
+
+    def _parse(self):
+        """Parse everything, returning (entries, paths of the files actually parsed)"""
+        with mock.patch.object(self.parser, 'parse_log_file', wraps=self.parser.parse_log_file) as parse_file:
+            entries = self.parser.parse_all_logs(self.logs_dir, LOG_TYPES)
+        return entries, sorted(call.args[0] for call in parse_file.call_args_list)
+
+    def test_unchanged_sessions_are_not_reparsed(self):
+        _write_log(self._session_file('user1'), 3)
+        _write_log(self._session_file('user1', 'network_dns.log'), 2)
+
+        first_entries, first_parsed = self._parse()
+        second_entries, second_parsed = self._parse()
+
+        self.assertEqual(len(first_parsed), 2)
+        self.assertEqual(second_parsed, [])
+        self.assertEqual(len(first_entries), 5)
+        self.assertEqual(second_entries, first_entries)
+
+    def test_modified_file_reparses_its_session_only(self):
+        changed = self._session_file('user1')
+        _write_log(changed, 3)
+        _write_log(self._session_file('user2'), 3)
+        self._parse()
+
+        _write_log(changed, 4)
+        stat = os.stat(changed)
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        entries, parsed = self._parse()
+
+        self.assertEqual(parsed, [changed])
+        self.assertEqual(len(entries), 7)
+
+    def test_same_size_rewrite_is_detected_by_mtime(self):
+        path = self._session_file('user1')
+        _write_log(path, 3)
+        self._parse()
+
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        _entries, parsed = self._parse()
+
+        self.assertEqual(parsed, [path])
+
+    def test_sessions_beyond_the_limit_are_evicted(self):
+        for user_id in ('user1', 'user2', 'user3'):
+            _write_log(self._session_file(user_id), 2)
+
+        with mock.patch.object(log_parser, 'PARSE_CACHE_MAX_SESSIONS', 2):
+            self._parse()
+            cached_users = {cache_key[0] for cache_key in self.parser._session_cache}
+            self.assertEqual(len(cached_users), 2)
+            evicted_user, = {'user1', 'user2', 'user3'} - cached_users
+
+            _entries, parsed = self._parse()
+            self.assertEqual(len(self.parser._session_cache), 2)
+
+        self.assertEqual(parsed, [self._session_file(evicted_user)])
+
+    def test_eviction_drops_least_recently_used_session(self):
+        with mock.patch.object(log_parser, 'PARSE_CACHE_MAX_SESSIONS', 2):
+            self.parser._store_cached_session(('a',), [[]])
+            self.parser._store_cached_session(('b',), [[]])
+            self.parser._get_cached_session(('a',))
+            self.parser._store_cached_session(('c',), [[]])
+
+            self.assertIsNotNone(self.parser._get_cached_session(('a',)))
+            self.assertIsNone(self.parser._get_cached_session(('b',)))
+            self.assertIsNotNone(self.parser._get_cached_session(('c',)))
+
+    def test_zero_limit_disables_the_cache(self):
+        _write_log(self._session_file('user1'), 2)
+
+        with mock.patch.object(log_parser, 'PARSE_CACHE_MAX_SESSIONS', 0):
+            self._parse()
+            _entries, parsed = self._parse()
+
+        self.assertEqual(len(parsed), 1)
+        self.assertEqual(len(self.parser._session_cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests for the inotify log watcher's change detection
+Run with: python -m unittest test_watcher_inotify
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import api_server
+
+
+WAIT_SECONDS = 5
+
+
+@unittest.skipUnless(api_server.INOTIFY_AVAILABLE, 'inotify_simple is not installed')
+class InotifyWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.logs_dir = tmp_dir.name
+        self.session_dir = os.path.join(self.logs_dir, 'user1', 'soc-PC1', '2026-01-01_10-00-00')
+        os.makedirs(self.session_dir)
+        self.log_path = os.path.join(self.session_dir, 'network_logs.txt')
+        with open(self.log_path, 'w') as f:
+            f.write('Event #1\n')
+
+        self.runs = threading.Semaphore(0)
+        patchers = [
+            mock.patch.object(api_server, 'LOGS_DIR', self.logs_dir),
+            mock.patch.object(api_server, 'WATCH_SETTLE_SECONDS', 0),
+            mock.patch.object(api_server, 'WATCH_EVENT_TIMEOUT_MS', 50),
+            mock.patch.object(api_server, '_is_interval_run_due', return_value=False),
+            mock.patch.object(api_server, '_run_watcher_analysis', side_effect=self._record_run),
+            mock.patch.dict(api_server._dir_index, clear=True),
+            mock.patch.dict(api_server.analysis_state),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # The current logs count as analyzed, so the watcher has no startup run
+        api_server.analysis_state['last_logs_signature'] = api_server._compute_logs_signature()
+        api_server._compute_logs_signature_incremental()
+        self.assertIn(self.session_dir, api_server._dir_index)
+
+        stop_event = threading.Event()
+        watcher = threading.Thread(target=api_server._watcher_loop_inotify, args=(stop_event,), daemon=True)
+        watcher.start()
+        self.addCleanup(watcher.join, WAIT_SECONDS)
+        self.addCleanup(stop_event.set)
+        # Give the watcher time to add its watches before the test touches files
+        self.assertFalse(self.runs.acquire(timeout=0.3))
+
+    def _record_run(self):
+        self.runs.release()
+        return True
+
+    def test_append_through_open_handle_triggers_analysis(self):
+        with open(self.log_path, 'a') as f:
+            f.write('Event #2\n')
+            f.flush()
+            self.assertTrue(self.runs.acquire(timeout=WAIT_SECONDS))
+
+    def test_deleted_log_triggers_analysis_and_leaves_index(self):
+        os.remove(self.log_path)
+
+        self.assertTrue(self.runs.acquire(timeout=WAIT_SECONDS))
+        self.assertNotIn(self.session_dir, api_server._dir_index)
+
+    def test_log_renamed_away_triggers_analysis(self):
+        os.rename(self.log_path, os.path.join(self.logs_dir, 'archived.bak'))
+
+        self.assertTrue(self.runs.acquire(timeout=WAIT_SECONDS))
+        self.assertNotIn(self.session_dir, api_server._dir_index)
+
+    def test_removed_session_tree_leaves_index(self):
+        user_dir = os.path.join(self.logs_dir, 'user1')
+        moved_to = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, moved_to, True)
+        os.rename(user_dir, os.path.join(moved_to, 'user1'))
+
+        self.assertTrue(self.runs.acquire(timeout=WAIT_SECONDS))
+        self.assertFalse([path for path in api_server._dir_index if path.startswith(user_dir)])
+
+
+if __name__ == '__main__':
+    unittest.main()